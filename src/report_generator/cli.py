@@ -161,11 +161,21 @@ def interactive_mode():
     return result
 
 
-def main():
-    """Main CLI entry point."""
+def main(argv=None):
+    """
+    Main CLI entry point.
+
+    Args:
+        argv: Optional list of command-line arguments (without the program
+              name). Defaults to sys.argv[1:]. Passing it explicitly avoids
+              mutating global state (useful for tests and embedding).
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+
     # If no arguments provided, run interactive mode
     # (happens when double-clicking the app)
-    if len(sys.argv) == 1:
+    if not argv:
         return interactive_mode()
 
     # Otherwise, use normal CLI parsing
@@ -226,7 +236,7 @@ Examples:
     subparsers.add_parser("list-reports", help="List available report types")
 
     # Parse arguments
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Execute command
     if args.command == "generate":
@@ -79,30 +79,48 @@ class TabularDataLoader:  # pylint: disable=too-few-public-methods
             # Let pandas auto-detect (handles both comma and tab)
             delimiter = ","
 
-        # Load file with pandas
+        return self._load_buffer(filepath, delimiter=delimiter)
+
+    def _load_buffer(self, source, delimiter=","):
+        """
+        Parse and validate delimited data from a path or file-like object.
+
+        Everything pandas accepts as a source works here, so callers that
+        already hold the data in memory (e.g. a StringIO) can skip the
+        filesystem entirely.
+
+        Args:
+            source: Path, string path, or file-like object to read from.
+            delimiter: Field delimiter to pass to pandas.
+
+        Returns:
+            List of dictionaries, where each dict represents one row.
+
+        Raises:
+            ValueError: If the data is empty or malformed.
+        """
         try:
-            df = pd.read_csv(filepath, sep=delimiter, encoding="utf-8-sig")
+            df = pd.read_csv(source, sep=delimiter, encoding="utf-8-sig")
         except pd.errors.EmptyDataError as exc:
             raise ValueError(
-                f"File is empty: {filepath}\n"
+                f"File is empty: {source}\n"
                 f"The file must contain a header row and at least one data row."
             ) from exc
         except pd.errors.ParserError as exc:
             raise ValueError(
-                f"File is malformed: {filepath}\n"
+                f"File is malformed: {source}\n"
                 f"The file could not be parsed as valid delimited data.\n"
                 f"Error: {exc}\n"
                 "Please check that the file uses comma or tab delimiters "
                 "and has consistent columns."
             ) from exc
         except Exception as exc:
-            raise ValueError(f"Error reading file: {filepath}\nError: {exc}") from exc
+            raise ValueError(f"Error reading file: {source}\nError: {exc}") from exc
 
         # Check if DataFrame is empty
         if df.empty:
             raise ValueError(
-                f"File contains no data: {filepath}\n"
-                f"The file must contain at least one data row."
+                f"File contains no data: {source}\n" f"The file must contain at least one data row."
             )
 
         # Validate minimum structure
@@ -110,13 +128,11 @@ class TabularDataLoader:  # pylint: disable=too-few-public-methods
         min_columns = 3
         if len(df.columns) < min_columns:
             raise ValueError(
-                f"File appears to be malformed: {filepath}\n"
+                f"File appears to be malformed: {source}\n"
                 f"Expected at least {min_columns} columns, but found {len(df.columns)}.\n"
                 f"Columns found: {list(df.columns)}\n"
                 f"Please check that the file uses comma or tab delimiters."
             )
 
         # Convert to list of dictionaries
-        data = df.to_dict("records")
-
-        return data
+        return df.to_dict("records")
@@ -11,7 +11,7 @@ The validator checks structure only - templates handle missing/incomplete data.
 from typing import Any, Dict, List
 
 
-class DataValidator:  # pylint: disable=too-few-public-methods
+class DataValidator:
     """
     Validates reports data structure (not content).
 
@@ -54,7 +54,8 @@ class DataValidator:  # pylint: disable=too-few-public-methods
                 'valid': bool,           # False only for catastrophic failures
                 'errors': List[str],     # Catastrophic issues
                 'warnings': List[str],   # Structure issues (non-fatal)
-                'info': List[str]        # Informational messages
+                'info': List[str],       # Informational messages
+                'codes': List[str]       # Stable machine-readable tags
             }
 
         Example:
@@ -70,8 +71,34 @@ class DataValidator:  # pylint: disable=too-few-public-methods
             ["Missing expected columns: City"]
         """
         schema_config = schema_config or {}
+        expected_columns = frozenset(schema_config.get("expected_columns", ()))
+        return self._validate_with_expected(data, expected_columns)
 
-        result = {"valid": True, "errors": [], "warnings": [], "info": []}
+    def validate_batch(
+        self, datasets: List[List[Dict[str, Any]]], schema_config: dict = None
+    ) -> List[dict]:
+        """
+        Validate several datasets against one schema.
+
+        Normalizes the schema a single time and reuses it across every
+        dataset, so per-dataset work is only the structural checks.
+
+        Args:
+            datasets: List of datasets, each a list of row dictionaries
+            schema_config: Optional dictionary with 'expected_columns' list
+
+        Returns:
+            One validate()-style result dictionary per dataset, in order
+        """
+        schema_config = schema_config or {}
+        expected_columns = frozenset(schema_config.get("expected_columns", ()))
+        return [self._validate_with_expected(data, expected_columns) for data in datasets]
+
+    def _validate_with_expected(
+        self, data: List[Dict[str, Any]], expected_columns: frozenset
+    ) -> dict:
+        """Run the structural checks against a pre-normalized column set."""
+        result = {"valid": True, "errors": [], "warnings": [], "info": [], "codes": []}
 
         # Catastrophic check: No data at all
         if not data or len(data) == 0:
@@ -79,6 +106,7 @@ class DataValidator:  # pylint: disable=too-few-public-methods
             result["errors"].append(
                 "No data to validate. " "The data list is empty - cannot generate reports."
             )
+            result["codes"].append("no_data")
             return result
 
         # Catastrophic check: Data exists but has no columns
@@ -88,14 +116,13 @@ class DataValidator:  # pylint: disable=too-few-public-methods
             result["errors"].append(
                 "Data has no columns. " "The data structure is broken - cannot generate reports."
             )
+            result["codes"].append("no_columns")
             return result
 
-        # Non-catastrophic checks: Structure warnings
-        expected_columns = set(schema_config.get("expected_columns", []))
-        actual_columns = set(first_row.keys())
-
+        # Non-catastrophic checks: Structure warnings. dict keys views
+        # support set operations directly, so no per-call set() copies.
         # Check for missing expected columns
-        missing_columns = expected_columns - actual_columns
+        missing_columns = expected_columns - first_row.keys()
         if missing_columns:
             result["warnings"].append(
                 f"Missing expected columns: {', '.join(sorted(missing_columns))}"
@@ -103,12 +130,14 @@ class DataValidator:  # pylint: disable=too-few-public-methods
             result["info"].append(
                 "Report will handle missing data by showing empty values or placeholders."
             )
+            result["codes"].append("missing_columns")
 
         # Check for unexpected columns (informational only)
-        unexpected_columns = actual_columns - expected_columns
+        unexpected_columns = first_row.keys() - expected_columns
         if unexpected_columns and expected_columns:  # Only if we have expectations
             unexpected_list = ", ".join(sorted(unexpected_columns))
             result["info"].append(f"Found unexpected columns (will be ignored): {unexpected_list}")
+            result["codes"].append("unexpected_columns")
 
         # Check data consistency across rows (optional - informational)
         if len(data) > 1:
@@ -119,6 +148,7 @@ class DataValidator:  # pylint: disable=too-few-public-methods
                     f"Rows with issues: {', '.join(map(str, inconsistent_rows))}"
                 )
                 result["info"].append("This may indicate data quality issues in the source.")
+                result["codes"].append("inconsistent_rows")
 
         return result
 
@@ -138,11 +168,14 @@ class DataValidator:  # pylint: disable=too-few-public-methods
         if not data:
             return []
 
-        first_row_columns = set(data[0].keys())
+        # keys views compare as sets, so no set() copy per row; bind the
+        # append method once so the loop body is pure LOAD_FAST
+        first_row_columns = data[0].keys()
         inconsistent = []
+        flag_row = inconsistent.append
 
         for i, row in enumerate(data[1:], start=2):  # Start at row 2
-            if set(row.keys()) != first_row_columns:
-                inconsistent.append(i)
+            if row.keys() != first_row_columns:
+                flag_row(i)
 
         return inconsistent
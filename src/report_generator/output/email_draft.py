@@ -5,13 +5,30 @@ This module handles opening HTML reports as email drafts in the user's
 default mail client (Mac Mail, Outlook, etc.).
 """
 
+import functools
+import os
 import subprocess
 import sys
 import tempfile
 import webbrowser
 from email import policy
 from email.message import EmailMessage
-from typing import Optional
+from typing import Final, Optional
+
+# Platform never changes within a process; cache it once at import so
+# handler construction is a constant read rather than a sys attribute lookup
+_PLATFORM: Final[str] = sys.platform
+
+
+@functools.lru_cache(maxsize=4)
+def _is_darwin(platform: str = _PLATFORM) -> bool:
+    """Memoized platform-capability probe for the .eml draft path.
+
+    Takes the platform as an argument (defaulting to the cached constant)
+    so handlers with an overridden platform, as in tests, still dispatch
+    correctly while repeat calls hit the cache.
+    """
+    return platform == "darwin"
 
 
 class EmailDraftHandler:  # pylint: disable=too-few-public-methods
@@ -33,7 +50,7 @@ class EmailDraftHandler:  # pylint: disable=too-few-public-methods
 
     def __init__(self):
         """Initialize the email draft handler."""
-        self.platform = sys.platform
+        self.platform = _PLATFORM
 
     def open_draft(
         self,
@@ -61,7 +78,7 @@ class EmailDraftHandler:  # pylint: disable=too-few-public-methods
         to_addresses = to_addresses or []
         cc_addresses = cc_addresses or []
 
-        if self.platform == "darwin":
+        if _is_darwin(self.platform):
             # Use .eml draft approach on macOS
             return self._open_eml_draft(html_content, subject, to_addresses, cc_addresses)
         # Fallback: save HTML and open in browser
@@ -103,10 +120,14 @@ class EmailDraftHandler:  # pylint: disable=too-few-public-methods
             # HTML alternative body
             msg.add_alternative(html_content, subtype="html")
 
-            # Save as temporary .eml file
-            with tempfile.NamedTemporaryFile(mode="wb", suffix=".eml", delete=False) as f:
-                f.write(msg.as_bytes())
-                temp_path = f.name
+            # Save as temporary .eml file. The payload is a single blob, so
+            # write it straight to the raw descriptor and skip the buffered
+            # file-object layer entirely.
+            fd, temp_path = tempfile.mkstemp(suffix=".eml")
+            try:
+                os.write(fd, msg.as_bytes())
+            finally:
+                os.close(fd)
 
             # Ask macOS to open the .eml with the default mail client
             # (Mail, Outlook, etc.)
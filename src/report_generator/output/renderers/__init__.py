@@ -7,7 +7,7 @@ This module provides rendering strategies for different audiences:
 - PartnerRenderer: External-safe, sanitized information
 """
 
-from report_generator.output.renderers.base import AudienceRenderer
+from report_generator.output.renderers.base import AudienceRenderer, get_environment
 from report_generator.output.renderers.executive import ExecutiveRenderer
 from report_generator.output.renderers.partner import PartnerRenderer
 from report_generator.output.renderers.technical import TechnicalRenderer
@@ -17,4 +17,5 @@ __all__ = [
     "ExecutiveRenderer",
     "TechnicalRenderer",
     "PartnerRenderer",
+    "get_environment",
 ]
@@ -6,10 +6,40 @@ must implement.
 """
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+
+@lru_cache(maxsize=None)
+def get_environment(template_dir: Path) -> Environment:
+    """
+    Return a shared Jinja2 environment for a template directory.
+
+    Environments (and the templates they compile) are cached per
+    directory, so multiple renderers over the same templates reuse one
+    environment and each template is parsed and compiled only once per
+    process. auto_reload is disabled because templates ship with the
+    package and never change at runtime. A filesystem bytecode cache
+    persists compiled templates across processes, so cold starts skip
+    template parsing entirely. The cache uses Jinja's default per-user
+    temp directory rather than a fixed shared path: loading bytecode is
+    executing it, and Jinja only applies its ownership and permission
+    checks to the directory it creates itself.
+
+    Args:
+        template_dir: Directory containing Jinja2 templates
+
+    Returns:
+        Cached Environment for that directory
+    """
+    return Environment(
+        loader=FileSystemLoader(template_dir),
+        auto_reload=False,
+        bytecode_cache=FileSystemBytecodeCache(),
+    )
 
 
 class AudienceRenderer(ABC):
@@ -27,15 +57,17 @@ class AudienceRenderer(ABC):
         >>> html = renderer.render(context, logo_base64="...")
     """
 
-    def __init__(self, template_dir: Path):
+    def __init__(self, template_dir: Path, env: Optional[Environment] = None):
         """
         Initialize renderer with template directory.
 
         Args:
             template_dir: Directory containing Jinja2 templates
+            env: Pre-built Jinja2 environment to reuse. Defaults to the
+                shared cached environment for template_dir.
         """
         self.template_dir = template_dir
-        self.jinja_env = Environment(loader=FileSystemLoader(template_dir))
+        self.jinja_env = env if env is not None else get_environment(template_dir)
 
     @abstractmethod
     def get_template_name(self) -> str:
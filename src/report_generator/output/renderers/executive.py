@@ -12,6 +12,9 @@ from typing import Any, Dict
 
 from report_generator.output.renderers.base import AudienceRenderer
 
+# Statuses executives need to see; everything else is summarized as a count
+_CRITICAL_STATUSES = frozenset({"Off Track", "At Risk"})
+
 
 class ExecutiveRenderer(AudienceRenderer):
     """
@@ -61,18 +64,17 @@ class ExecutiveRenderer(AudienceRenderer):
         # Filter status groups to prioritize critical items
         # Only show "Off Track" and "At Risk" - executives don't need to see "On Track"
         if "status_groups" in context:
-            critical_statuses = {"Off Track", "At Risk"}
             exec_context["status_groups_filtered"] = [
                 (status, items)
                 for status, items in context["status_groups"]
-                if status in critical_statuses
+                if status in _CRITICAL_STATUSES
             ]
 
             # Count on-track items for summary display
             on_track_count = sum(
                 len(items)
                 for status, items in context["status_groups"]
-                if status not in critical_statuses
+                if status not in _CRITICAL_STATUSES
             )
             exec_context["on_track_count"] = on_track_count
 
@@ -6,7 +6,7 @@ program status, risks, and blockers.
 """
 
 import json
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 
 def build_prompt(context: Dict[str, Any]) -> Optional[str]:
@@ -119,14 +119,16 @@ def build_prompt(context: Dict[str, Any]) -> Optional[str]:
     return "\n".join(prompt_parts)
 
 
-def parse_response(response: str) -> Dict[str, Any]:
+def parse_response(response: Union[str, bytes]) -> Dict[str, Any]:
     """
     Parse LLM response into structured action items.
 
     Expects JSON format with action items list.
 
     Args:
-        response: Raw LLM response text
+        response: Raw LLM response, as text or UTF-8 bytes. Bytes are fed
+            to json.loads directly (no decode round-trip) unless markdown
+            fences need stripping first.
 
     Returns:
         Dictionary with parsed action items
@@ -137,8 +139,14 @@ def parse_response(response: str) -> Dict[str, Any]:
     # Clean up response - extract JSON if wrapped in markdown
     response = response.strip()
 
+    # Bytes only need decoding when fences must be stripped; otherwise
+    # json.loads accepts UTF-8 bytes as-is
+    if isinstance(response, (bytes, bytearray)):
+        if response.startswith(b"```"):
+            response = response.decode("utf-8")
+
     # Remove markdown code fences if present
-    if response.startswith("```"):
+    if isinstance(response, str) and response.startswith("```"):
         lines = response.split("\n")
         # Remove first line (```json or ```)
         lines = lines[1:]
@@ -5,8 +5,49 @@ This module generates prompts for creating concise executive summaries
 of program status reports.
 """
 
+import re
 from typing import Any, Dict, List, Tuple
 
+# Statuses that flag a deliverable as critical, as an O(1)-membership set
+_CRITICAL_STATUSES = frozenset({"Off Track", "At Risk"})
+
+# Placeholder risk values that mean "nothing to report" (compared lowercase)
+_EMPTY_RISK_SENTINELS = frozenset(
+    {
+        "no risks or issues reported this week",
+        "none",
+        "n/a",
+        "",
+    }
+)
+
+# Common LLM preambles stripped from responses, compiled once at import
+_PREAMBLE_RE = re.compile(
+    r"^\s*(?:Here is the executive summary|Executive Summary|Summary)\s*:\s*",
+    re.IGNORECASE,
+)
+
+# Static prompt scaffolding, hoisted so only the dynamic report sections
+# are formatted per call
+_PROMPT_HEADER = "You are analyzing a weekly program status report for a technical program manager."
+
+_PROMPT_FOOTER = """## Task
+Generate a concise executive summary (2-3 sentences) that:
+
+1. **States overall program health** - Is the program on track, at risk, or facing major issues?
+2. **Highlights the most critical item** - What single issue requires immediate attention?
+3. **Identifies any emerging patterns** - Are there themes across multiple deliverables (e.g., resource constraints, dependency delays)?
+
+## Guidelines
+- Be specific and decision-oriented (not generic)
+- Focus on actionable insights, not just facts
+- Use concrete examples from the data
+- Avoid phrases like "the report shows" or "according to the data"
+- Write in present tense, as if briefing an executive right now
+
+## Output Format
+Return ONLY the executive summary text (2-3 sentences). No preamble, explanation, or formatting."""
+
 
 def build_prompt(context: Dict[str, Any]) -> str:
     """
@@ -37,7 +78,7 @@ def build_prompt(context: Dict[str, Any]) -> str:
     critical_items = _extract_critical_items(status_groups)
     risks_summary = _extract_risks_summary(status_groups)
 
-    prompt = f"""You are analyzing a weekly program status report for a technical program manager.
+    return f"""{_PROMPT_HEADER}
 
 ## Report Metadata
 - Report Date: {report_date}
@@ -52,24 +93,7 @@ def build_prompt(context: Dict[str, Any]) -> str:
 ## Reported Risks and Issues
 {risks_summary}
 
-## Task
-Generate a concise executive summary (2-3 sentences) that:
-
-1. **States overall program health** - Is the program on track, at risk, or facing major issues?
-2. **Highlights the most critical item** - What single issue requires immediate attention?
-3. **Identifies any emerging patterns** - Are there themes across multiple deliverables (e.g., resource constraints, dependency delays)?
-
-## Guidelines
-- Be specific and decision-oriented (not generic)
-- Focus on actionable insights, not just facts
-- Use concrete examples from the data
-- Avoid phrases like "the report shows" or "according to the data"
-- Write in present tense, as if briefing an executive right now
-
-## Output Format
-Return ONLY the executive summary text (2-3 sentences). No preamble, explanation, or formatting."""
-
-    return prompt
+{_PROMPT_FOOTER}"""
 
 
 def _format_status_breakdown(status_groups: List[Tuple[str, List[Dict]]]) -> str:
@@ -103,26 +127,25 @@ def _extract_critical_items(status_groups: List[Tuple[str, List[Dict]]]) -> str:
     Returns:
         Formatted string with critical deliverable details
     """
-    critical_statuses = ["Off Track", "At Risk"]
     critical_items = []
 
     for status, items in status_groups:
-        if status in critical_statuses:
+        if status in _CRITICAL_STATUSES:
             for item in items:
                 deliverable = item.get("deliverable", "Unknown")
                 priority = item.get("priority", "")
                 risks = item.get("risks_issues", "").strip()
 
-                # Build item description
-                desc = f"- [{status}] {deliverable}"
+                # Build item description (joined once, no repeated concatenation)
+                desc_parts = [f"- [{status}] {deliverable}"]
                 if priority:
-                    desc += f" (Priority: {priority})"
+                    desc_parts.append(f" (Priority: {priority})")
                 if risks:
                     # Truncate long risk descriptions
                     risks_short = risks[:150] + "..." if len(risks) > 150 else risks
-                    desc += f"\n  Risk: {risks_short}"
+                    desc_parts.append(f"\n  Risk: {risks_short}")
 
-                critical_items.append(desc)
+                critical_items.append("".join(desc_parts))
 
     if not critical_items:
         return "  (No critical items - all deliverables on track or complete)"
@@ -147,11 +170,7 @@ def _extract_risks_summary(status_groups: List[Tuple[str, List[Dict]]]) -> str:
             deliverable = item.get("deliverable", "Unknown")
             risks = item.get("risks_issues", "").strip()
 
-            if risks and risks.lower() not in [
-                "no risks or issues reported this week",
-                "none",
-                "n/a",
-            ]:
+            if risks.lower() not in _EMPTY_RISK_SENTINELS:
                 all_risks.append(f"- {deliverable}: {risks}")
 
     if not all_risks:
@@ -180,18 +199,8 @@ def parse_response(response: str) -> Dict[str, Any]:
         >>> parsed["summary"]
         'Program is on track with 2 at-risk items...'
     """
-    # Clean up response
-    summary = response.strip()
-
-    # Remove common LLM preambles if present
-    preambles = [
-        "Here is the executive summary:",
-        "Executive Summary:",
-        "Summary:",
-    ]
-    for preamble in preambles:
-        if summary.startswith(preamble):
-            summary = summary[len(preamble) :].strip()
+    # Clean up response and remove common LLM preambles if present
+    summary = _PREAMBLE_RE.sub("", response.strip(), count=1).strip()
 
     return {
         "summary": summary,
@@ -5,8 +5,28 @@ This module generates prompts for analyzing risks and extracting themes
 across deliverables in a program status report.
 """
 
+import json
 from typing import Any, Dict, List, Tuple
 
+# Optional C-accelerated JSON parser. orjson is not a hard dependency;
+# when it is installed we use it for the response parse (its
+# JSONDecodeError subclasses the stdlib one, so error handling is shared).
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
+# Placeholder risk values that mean "nothing to report" (compared
+# lowercase), built once for O(1) membership checks per deliverable
+_EMPTY_RISK_PHRASES = frozenset(
+    {
+        "no risks or issues reported this week",
+        "none",
+        "n/a",
+        "",
+    }
+)
+
 
 def build_prompt(context: Dict[str, Any]) -> str:
     """
@@ -106,12 +126,7 @@ def _extract_risks(status_groups: List[Tuple[str, List[Dict]]]) -> List[Dict[str
             risk_text = item.get("risks_issues", "").strip()
 
             # Skip empty or default risks
-            if risk_text and risk_text.lower() not in [
-                "no risks or issues reported this week",
-                "none",
-                "n/a",
-                "",
-            ]:
+            if risk_text and risk_text.lower() not in _EMPTY_RISK_PHRASES:
                 risks.append({"deliverable": deliverable, "status": status, "risk": risk_text})
 
     return risks
@@ -144,19 +159,14 @@ def parse_response(response: str) -> Dict[str, Any]:
         >>> parsed["themes"]
         [{"name": "Resource Constraints", ...}]
     """
-    import json
-
     try:
         # Parse JSON
-        data = json.loads(response.strip())
+        data = _loads(response.strip())
 
         # Validate structure
-        if "themes" not in data:
-            data["themes"] = []
-        if "critical_risks" not in data:
-            data["critical_risks"] = []
-        if "anomalies" not in data:
-            data["anomalies"] = []
+        data.setdefault("themes", [])
+        data.setdefault("critical_risks", [])
+        data.setdefault("anomalies", [])
 
         return data
 
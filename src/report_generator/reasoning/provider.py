@@ -7,9 +7,10 @@ easy switching between providers without changing downstream code.
 """
 
 import os
+import threading
 import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 
 class LLMProvider(ABC):
@@ -53,6 +54,23 @@ class LLMProvider(ABC):
         """
         pass
 
+    def generate_batch(self, requests: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """
+        Generate responses for several prompts.
+
+        The default implementation calls generate() once per request;
+        providers with a native batch endpoint should override this to
+        submit one job instead of N round-trips.
+
+        Args:
+            requests: List of keyword-argument dicts for generate()
+                (prompt, system_prompt, max_tokens, temperature)
+
+        Returns:
+            Responses in request order; None for requests that failed
+        """
+        return [self.generate(**request) for request in requests]
+
     @abstractmethod
     def get_token_usage(self) -> Dict[str, int]:
         """
@@ -95,12 +113,14 @@ class AnthropicProvider(LLMProvider):
     DEFAULT_MODEL = "claude-sonnet-4-5-20250929"
     MAX_RETRIES = 3
     RETRY_DELAY = 1.0  # seconds
+    BATCH_POLL_INTERVAL = 5.0  # seconds
 
     def __init__(
         self,
         api_key: Optional[str] = None,
         model: Optional[str] = None,
         max_retries: int = MAX_RETRIES,
+        http_client: Optional[Any] = None,
     ):
         """
         Initialize Anthropic provider.
@@ -109,6 +129,9 @@ class AnthropicProvider(LLMProvider):
             api_key: Anthropic API key (if None, reads from ANTHROPIC_API_KEY env var)
             model: Model ID to use (if None, uses DEFAULT_MODEL or ANTHROPIC_MODEL env var)
             max_retries: Maximum number of retry attempts for failed requests
+            http_client: Optional pre-configured httpx.Client to reuse an
+                existing connection pool (e.g. with HTTP/2 enabled) across
+                providers; the SDK manages its own client when None
 
         Raises:
             ValueError: If API key is not provided and not in environment
@@ -123,21 +146,43 @@ class AnthropicProvider(LLMProvider):
         self.model = model or os.getenv("ANTHROPIC_MODEL", self.DEFAULT_MODEL)
         self.max_retries = max_retries
 
-        # Token usage tracking
+        # Token usage tracking. The synthesizer calls generate() from
+        # worker threads, so the += read-modify-writes are guarded by a
+        # lock to keep the counters exact.
+        self._usage_lock = threading.Lock()
         self._input_tokens = 0
         self._output_tokens = 0
+        self._cache_read_tokens = 0
 
         # Lazy import to avoid requiring anthropic package if not using this provider
         try:
             import anthropic
 
-            self.client = anthropic.Anthropic(api_key=self.api_key)
+            self.client = anthropic.Anthropic(api_key=self.api_key, http_client=http_client)
         except ImportError as e:
             raise ImportError(
                 "anthropic package is required for AnthropicProvider. "
                 "Install it with: pip install anthropic"
             ) from e
 
+    def _record_usage(self, usage: Any) -> None:
+        """Accumulate token counts from a response usage block, thread-safely."""
+        cache_read = getattr(usage, "cache_read_input_tokens", 0) or 0
+        with self._usage_lock:
+            self._input_tokens += usage.input_tokens
+            self._output_tokens += usage.output_tokens
+            self._cache_read_tokens += cache_read
+
+    def close(self) -> None:
+        """Close the underlying HTTP client and its connection pool."""
+        self.client.close()
+
+    def __enter__(self) -> "AnthropicProvider":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def generate(
         self,
         prompt: str,
@@ -170,6 +215,20 @@ class AnthropicProvider(LLMProvider):
         if not 0.0 <= temperature <= 1.0:
             raise ValueError("temperature must be between 0.0 and 1.0")
 
+        # Mark the static system prompt as cacheable: the API then reuses
+        # the server-side prefix on subsequent calls instead of
+        # re-processing it, cutting input cost and latency on cache hits.
+        if system_prompt:
+            system = [
+                {
+                    "type": "text",
+                    "text": system_prompt,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ]
+        else:
+            system = ""
+
         # Retry loop for transient failures
         last_error = None
         for attempt in range(self.max_retries):
@@ -178,13 +237,12 @@ class AnthropicProvider(LLMProvider):
                     model=self.model,
                     max_tokens=max_tokens,
                     temperature=temperature,
-                    system=system_prompt or "",
+                    system=system,
                     messages=[{"role": "user", "content": prompt}],
                 )
 
-                # Track token usage
-                self._input_tokens += response.usage.input_tokens
-                self._output_tokens += response.usage.output_tokens
+                # Track token usage (cache reads are reported separately)
+                self._record_usage(response.usage)
 
                 # Extract text from response
                 return response.content[0].text
@@ -202,22 +260,153 @@ class AnthropicProvider(LLMProvider):
             f"Failed to generate response after {self.max_retries} attempts: {last_error}"
         ) from last_error
 
+    def stream_generate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: int = 1024,
+        temperature: float = 0.0,
+    ) -> Iterator[str]:
+        """
+        Generate text incrementally, yielding chunks as they arrive.
+
+        Streaming cuts perceived latency from total generation time to
+        time-to-first-token. There is no retry loop here: once chunks
+        have been yielded the call cannot be transparently restarted.
+
+        Args:
+            prompt: The user prompt
+            system_prompt: Optional system context
+            max_tokens: Maximum response tokens
+            temperature: Sampling temperature (0.0-1.0)
+
+        Yields:
+            Response text chunks in order
+
+        Raises:
+            LLMProviderError: If the streaming call fails
+            ValueError: If parameters are invalid
+        """
+        if not prompt or not prompt.strip():
+            raise ValueError("Prompt cannot be empty")
+
+        if max_tokens <= 0:
+            raise ValueError("max_tokens must be positive")
+
+        if not 0.0 <= temperature <= 1.0:
+            raise ValueError("temperature must be between 0.0 and 1.0")
+
+        if system_prompt:
+            system = [
+                {
+                    "type": "text",
+                    "text": system_prompt,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ]
+        else:
+            system = ""
+
+        try:
+            with self.client.messages.stream(
+                model=self.model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                system=system,
+                messages=[{"role": "user", "content": prompt}],
+            ) as stream:
+                for text in stream.text_stream:
+                    yield text
+
+                self._record_usage(stream.get_final_message().usage)
+
+        except Exception as e:
+            raise LLMProviderError(f"Streaming generation failed: {e}") from e
+
+    def generate_batch(self, requests: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """
+        Generate responses for several prompts via the Message Batches API.
+
+        Submits all requests as a single batch job and polls until it
+        completes. One HTTP round-trip replaces N, and the server fans
+        the work out; latency is dominated by the slowest request rather
+        than the sum of all of them.
+
+        Args:
+            requests: List of keyword-argument dicts (prompt, system_prompt,
+                max_tokens, temperature)
+
+        Returns:
+            Responses in request order; None for requests that failed
+        """
+        if not requests:
+            return []
+
+        batch_requests = []
+        for index, request in enumerate(requests):
+            system_prompt = request.get("system_prompt")
+            if system_prompt:
+                system = [
+                    {
+                        "type": "text",
+                        "text": system_prompt,
+                        "cache_control": {"type": "ephemeral"},
+                    }
+                ]
+            else:
+                system = ""
+
+            batch_requests.append(
+                {
+                    "custom_id": str(index),
+                    "params": {
+                        "model": self.model,
+                        "max_tokens": request.get("max_tokens", 1024),
+                        "temperature": request.get("temperature", 0.0),
+                        "system": system,
+                        "messages": [{"role": "user", "content": request["prompt"]}],
+                    },
+                }
+            )
+
+        batch = self.client.messages.batches.create(requests=batch_requests)
+        while batch.processing_status == "in_progress":
+            time.sleep(self.BATCH_POLL_INTERVAL)
+            batch = self.client.messages.batches.retrieve(batch.id)
+
+        # Results stream in completion order; fan back into request order
+        responses: List[Optional[str]] = [None] * len(requests)
+        for result in self.client.messages.batches.results(batch.id):
+            if result.result.type != "succeeded":
+                continue  # Leave failed entries as None
+
+            message = result.result.message
+            self._record_usage(message.usage)
+            responses[int(result.custom_id)] = message.content[0].text
+
+        return responses
+
     def get_token_usage(self) -> Dict[str, int]:
         """
         Get cumulative token usage.
 
         Returns:
-            Dictionary with 'input_tokens' and 'output_tokens'
+            Dictionary with 'input_tokens', 'output_tokens', and
+            'cache_read_input_tokens'
         """
-        return {
-            "input_tokens": self._input_tokens,
-            "output_tokens": self._output_tokens,
-        }
+        with self._usage_lock:
+            return {
+                "input_tokens": self._input_tokens,
+                "output_tokens": self._output_tokens,
+                "cache_read_input_tokens": self._cache_read_tokens,
+            }
 
     def reset_token_usage(self) -> None:
         """Reset token counters."""
-        self._input_tokens = 0
-        self._output_tokens = 0
+        with self._usage_lock:
+            self._input_tokens = 0
+            self._output_tokens = 0
+            self._cache_read_tokens = 0
 
 
 # Placeholder for future providers
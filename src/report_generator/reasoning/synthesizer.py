@@ -5,8 +5,12 @@ This module orchestrates LLM reasoning over structured report data,
 generating executive summaries, risk analysis, and other insights.
 """
 
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from report_generator.reasoning.prompts import action_items, executive_summary, risk_analysis
 from report_generator.reasoning.provider import LLMProvider
@@ -46,6 +50,80 @@ class ReportSynthesizer:
         self.max_tokens = max_tokens
         self.temperature = temperature
 
+        # Client-side response cache for deterministic generations.
+        # Prompts are rendered from the context dict, so identical
+        # contexts produce identical prompts; at temperature 0.0 the
+        # response is deterministic too, and re-renders can skip the API
+        # round-trip entirely. Bounded LRU via OrderedDict, guarded by a
+        # lock because synthesize() fans features out to worker threads.
+        self._response_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    _RESPONSE_CACHE_SIZE = 256
+
+    # System prompts are static per feature; shared between the
+    # per-report path and the batch path so server-side prompt caching
+    # sees identical prefixes.
+    _SYSTEM_PROMPTS = {
+        "executive_summary": (
+            "You are an AI assistant helping a technical program manager "
+            "understand program status. Be concise, specific, and decision-oriented."
+        ),
+        "risk_analysis": (
+            "You are an AI assistant analyzing program risks. "
+            "Return valid JSON only. Be concise and specific."
+        ),
+        "action_items": (
+            "You are an AI Chief of Staff helping identify concrete next steps. "
+            "Return valid JSON only. Be specific and actionable."
+        ),
+    }
+
+    def _generate(
+        self,
+        prompt: str,
+        system_prompt: str,
+        max_tokens: int,
+    ) -> str:
+        """
+        Call the provider, caching responses when generation is deterministic.
+
+        Caching only applies at temperature 0.0: sampling at higher
+        temperatures is intentionally non-deterministic and must not be
+        replayed from a cache.
+        """
+        if self.temperature != 0.0:
+            return self.provider.generate(
+                prompt=prompt,
+                system_prompt=system_prompt,
+                max_tokens=max_tokens,
+                temperature=self.temperature,
+            )
+
+        model = getattr(self.provider, "model", "unknown")
+        key = hashlib.sha256(f"{model}|{max_tokens}|{system_prompt}|{prompt}".encode()).hexdigest()
+
+        with self._cache_lock:
+            if key in self._response_cache:
+                self._response_cache.move_to_end(key)
+                return self._response_cache[key]
+
+        # Generate outside the lock: concurrent misses on the same key
+        # may duplicate an API call, but never block each other.
+        response = self.provider.generate(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            max_tokens=max_tokens,
+            temperature=self.temperature,
+        )
+
+        with self._cache_lock:
+            self._response_cache[key] = response
+            if len(self._response_cache) > self._RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+
+        return response
+
     def synthesize(
         self,
         context: Dict[str, Any],
@@ -87,39 +165,25 @@ class ReportSynthesizer:
             "model": getattr(self.provider, "model", "unknown"),
         }
 
-        # Generate executive summary
+        # Each feature is an independent LLM round-trip, so run them
+        # concurrently when more than one is enabled: total latency is
+        # then the slowest call instead of the sum of all calls.
+        runners = []
         if features.get("executive_summary", False):
-            try:
-                summary_result = self._generate_executive_summary(context)
-                synthesis["executive_summary"] = summary_result["summary"]
-                synthesis["executive_summary_metadata"] = {
-                    "length": summary_result["length"],
-                    "sentence_count": summary_result["sentence_count"],
-                }
-            except Exception as e:
-                # Graceful degradation: log error but don't crash
-                synthesis["executive_summary"] = None
-                synthesis["executive_summary_error"] = str(e)
-
-        # Risk analysis
+            runners.append(self._synthesize_executive_summary)
         if features.get("risk_analysis", False):
-            try:
-                risk_result = self._analyze_risks(context)
-                if risk_result:  # Only add if there are risks to analyze
-                    synthesis["risk_analysis"] = risk_result
-            except Exception as e:
-                synthesis["risk_analysis"] = None
-                synthesis["risk_analysis_error"] = str(e)
+            runners.append(self._synthesize_risk_analysis)
+        if features.get("action_items", False):  # Phase 5
+            runners.append(self._synthesize_action_items)
 
-        # Action items (Phase 5)
-        if features.get("action_items", False):
-            try:
-                action_result = self._generate_action_items(context)
-                if action_result:  # Only add if there are actionable items
-                    synthesis["action_items"] = action_result
-            except Exception as e:
-                synthesis["action_items"] = None
-                synthesis["action_items_error"] = str(e)
+        if len(runners) > 1:
+            with ThreadPoolExecutor(max_workers=len(runners)) as executor:
+                fragments = list(executor.map(lambda run: run(context), runners))
+        else:
+            fragments = [run(context) for run in runners]
+
+        for fragment in fragments:
+            synthesis.update(fragment)
 
         # Return original context + synthesis
         return {
@@ -127,6 +191,212 @@ class ReportSynthesizer:
             "synthesis": synthesis,
         }
 
+    def synthesize_many(
+        self,
+        contexts: List[Dict[str, Any]],
+        features: Optional[Dict[str, bool]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate insights for several report contexts in one batch.
+
+        Builds one request per (context, enabled feature) pair and
+        submits them all through the provider's generate_batch, which
+        collapses N HTTP round-trips into a single batch job. Each
+        context gets the same synthesis structure synthesize() produces,
+        with per-feature graceful degradation.
+
+        Args:
+            contexts: List of structured report contexts
+            features: Optional dict to enable/disable features (same as
+                synthesize)
+
+        Returns:
+            List of enriched contexts, one per input, in order
+        """
+        if features is None:
+            features = {
+                "executive_summary": True,
+                "risk_analysis": True,
+                "action_items": False,
+            }
+
+        enabled = [name for name in self._SYSTEM_PROMPTS if features.get(name, False)]
+
+        # One request per (context, feature) with a non-empty prompt
+        requests = []
+        slots = []
+        for index, context in enumerate(contexts):
+            for feature in enabled:
+                request = self._build_feature_request(feature, context)
+                if request is not None:
+                    requests.append(request)
+                    slots.append((index, feature))
+
+        responses = self.provider.generate_batch(requests) if requests else []
+
+        syntheses = [
+            {
+                "generated_at": datetime.now().isoformat(),
+                "model": getattr(self.provider, "model", "unknown"),
+            }
+            for _ in contexts
+        ]
+        for (index, feature), response in zip(slots, responses):
+            syntheses[index].update(self._parse_feature_response(feature, response))
+
+        return [
+            {**context, "synthesis": synthesis} for context, synthesis in zip(contexts, syntheses)
+        ]
+
+    def synthesize_streaming(
+        self,
+        context: Dict[str, Any],
+        features: Optional[Dict[str, bool]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Generate insights, streaming the executive summary as it arrives.
+
+        Yields {"type": "executive_summary_delta", "text": chunk} events
+        while the summary is being generated, so callers can show text
+        at time-to-first-token instead of waiting for the full response.
+        Other enabled features run through the regular blocking path,
+        and the final event is {"type": "result", "context": enriched}
+        with the same structure synthesize() returns.
+
+        Args:
+            context: Structured data from builder
+            features: Optional dict to enable/disable features (same as
+                synthesize)
+
+        Yields:
+            Delta events followed by one final result event
+        """
+        if features is None:
+            features = {
+                "executive_summary": True,
+                "risk_analysis": True,
+                "action_items": False,
+            }
+
+        synthesis = {
+            "generated_at": datetime.now().isoformat(),
+            "model": getattr(self.provider, "model", "unknown"),
+        }
+
+        if features.get("executive_summary", False):
+            try:
+                prompt = executive_summary.build_prompt(context)
+                chunks = []
+                for chunk in self.provider.stream_generate(
+                    prompt=prompt,
+                    system_prompt=self._SYSTEM_PROMPTS["executive_summary"],
+                    max_tokens=self.max_tokens,
+                    temperature=self.temperature,
+                ):
+                    chunks.append(chunk)
+                    yield {"type": "executive_summary_delta", "text": chunk}
+
+                parsed = executive_summary.parse_response("".join(chunks))
+                synthesis.update(
+                    {
+                        "executive_summary": parsed["summary"],
+                        "executive_summary_metadata": {
+                            "length": parsed["length"],
+                            "sentence_count": parsed["sentence_count"],
+                        },
+                    }
+                )
+            except Exception as e:
+                synthesis.update({"executive_summary": None, "executive_summary_error": str(e)})
+
+        # Remaining features have no streaming value; run them blocking
+        if features.get("risk_analysis", False):
+            synthesis.update(self._synthesize_risk_analysis(context))
+        if features.get("action_items", False):
+            synthesis.update(self._synthesize_action_items(context))
+
+        yield {"type": "result", "context": {**context, "synthesis": synthesis}}
+
+    def _build_feature_request(
+        self, feature: str, context: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Build generate() kwargs for one feature, or None if nothing to ask."""
+        if feature == "executive_summary":
+            prompt = executive_summary.build_prompt(context)
+            max_tokens = self.max_tokens
+        elif feature == "risk_analysis":
+            prompt = risk_analysis.build_prompt(context)
+            max_tokens = self.max_tokens
+        else:
+            prompt = action_items.build_prompt(context)
+            max_tokens = self.max_tokens * 2  # Actions need more space
+
+        if prompt is None:
+            return None
+
+        return {
+            "prompt": prompt,
+            "system_prompt": self._SYSTEM_PROMPTS[feature],
+            "max_tokens": max_tokens,
+            "temperature": self.temperature,
+        }
+
+    def _parse_feature_response(self, feature: str, response: Optional[str]) -> Dict[str, Any]:
+        """Parse one batch response into a synthesis fragment, degrading gracefully."""
+        if response is None:
+            return {feature: None, f"{feature}_error": "batch request failed"}
+
+        try:
+            if feature == "executive_summary":
+                parsed = executive_summary.parse_response(response)
+                return {
+                    "executive_summary": parsed["summary"],
+                    "executive_summary_metadata": {
+                        "length": parsed["length"],
+                        "sentence_count": parsed["sentence_count"],
+                    },
+                }
+            if feature == "risk_analysis":
+                return {"risk_analysis": risk_analysis.parse_response(response)}
+            return {"action_items": action_items.parse_response(response)}
+        except Exception as e:
+            return {feature: None, f"{feature}_error": str(e)}
+
+    def _synthesize_executive_summary(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Run the executive summary feature, degrading gracefully on error."""
+        try:
+            summary_result = self._generate_executive_summary(context)
+            return {
+                "executive_summary": summary_result["summary"],
+                "executive_summary_metadata": {
+                    "length": summary_result["length"],
+                    "sentence_count": summary_result["sentence_count"],
+                },
+            }
+        except Exception as e:
+            # Graceful degradation: log error but don't crash
+            return {"executive_summary": None, "executive_summary_error": str(e)}
+
+    def _synthesize_risk_analysis(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Run the risk analysis feature, degrading gracefully on error."""
+        try:
+            risk_result = self._analyze_risks(context)
+            if risk_result:  # Only add if there are risks to analyze
+                return {"risk_analysis": risk_result}
+            return {}
+        except Exception as e:
+            return {"risk_analysis": None, "risk_analysis_error": str(e)}
+
+    def _synthesize_action_items(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Run the action items feature, degrading gracefully on error."""
+        try:
+            action_result = self._generate_action_items(context)
+            if action_result:  # Only add if there are actionable items
+                return {"action_items": action_result}
+            return {}
+        except Exception as e:
+            return {"action_items": None, "action_items_error": str(e)}
+
     def _generate_executive_summary(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Generate 2-3 sentence executive summary.
@@ -140,15 +410,11 @@ class ReportSynthesizer:
         # Build prompt
         prompt = executive_summary.build_prompt(context)
 
-        # Call LLM
-        response = self.provider.generate(
+        # Call LLM (cached when deterministic)
+        response = self._generate(
             prompt=prompt,
-            system_prompt=(
-                "You are an AI assistant helping a technical program manager "
-                "understand program status. Be concise, specific, and decision-oriented."
-            ),
+            system_prompt=self._SYSTEM_PROMPTS["executive_summary"],
             max_tokens=self.max_tokens,
-            temperature=self.temperature,
         )
 
         # Parse response
@@ -173,15 +439,11 @@ class ReportSynthesizer:
             # No risks to analyze
             return None
 
-        # Call LLM
-        response = self.provider.generate(
+        # Call LLM (cached when deterministic)
+        response = self._generate(
             prompt=prompt,
-            system_prompt=(
-                "You are an AI assistant analyzing program risks. "
-                "Return valid JSON only. Be concise and specific."
-            ),
+            system_prompt=self._SYSTEM_PROMPTS["risk_analysis"],
             max_tokens=self.max_tokens,
-            temperature=self.temperature,
         )
 
         # Parse response
@@ -216,14 +478,10 @@ class ReportSynthesizer:
             return None
 
         # Call LLM with higher token limit for action generation
-        response = self.provider.generate(
+        response = self._generate(
             prompt=prompt,
-            system_prompt=(
-                "You are an AI Chief of Staff helping identify concrete next steps. "
-                "Return valid JSON only. Be specific and actionable."
-            ),
+            system_prompt=self._SYSTEM_PROMPTS["action_items"],
             max_tokens=self.max_tokens * 2,  # Actions need more space
-            temperature=self.temperature,
         )
 
         # Parse response
@@ -8,11 +8,12 @@ Supports multi-audience rendering: executive, technical, partner views.
 """
 
 import base64
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Literal, Optional
 
-from jinja2 import Environment, FileSystemLoader
-
 from report_generator.data.loader import TabularDataLoader
 from report_generator.data.transformers import DataTransformer
 from report_generator.data.validator import DataValidator
@@ -21,6 +22,7 @@ from report_generator.output.renderers import (
     ExecutiveRenderer,
     PartnerRenderer,
     TechnicalRenderer,
+    get_environment,
 )
 from report_generator.reports.example_report.builder import KPRReportBuilder
 from report_generator.reports.example_report.config import (
@@ -32,6 +34,21 @@ from report_generator.reports.example_report.config import (
 AudienceType = Literal["executive", "technical", "partner"]
 
 
+def _reasoning_requested() -> bool:
+    """
+    Check whether the reasoning layer might be enabled, without importing it.
+
+    Importing report_generator.reasoning pulls in the LLM client stack, which
+    is wasted startup cost for the common case where reasoning is disabled.
+    The environment check mirrors ReasoningConfig's ENABLE_REASONING parsing.
+    If the reasoning module is already imported (e.g. config was set
+    programmatically via set_config), defer to the real config instead.
+    """
+    if "report_generator.reasoning" in sys.modules:
+        return True
+    return os.getenv("ENABLE_REASONING", "").lower() in ("true", "1", "yes", "on")
+
+
 class KPRReportGenerator:
     """
     Generates KPR HTML reports from CSV data.
@@ -54,8 +71,10 @@ class KPRReportGenerator:
         # Setup template directory
         self.template_dir = Path(__file__).parent
 
-        # Setup Jinja2 template environment (for backward compatibility)
-        self.jinja_env = Environment(loader=FileSystemLoader(self.template_dir))
+        # Setup Jinja2 template environment (for backward compatibility).
+        # The environment is cached per directory and shared with the
+        # audience renderers, so the templates compile once per process.
+        self.jinja_env = get_environment(self.template_dir)
         self.template = self.jinja_env.get_template("template.html")
 
         # Initialize audience renderers
@@ -114,6 +133,47 @@ class KPRReportGenerator:
             >>> # Partner view with output
             >>> html = generator.generate("data/kpr.csv", "output/partner.html", audience="partner")
         """
+        context = self._prepare_context(csv_path)
+
+        # Step 5: Render template (using audience renderer if specified)
+        print("Rendering HTML template...")
+        if audience and audience in self.renderers:
+            # Use audience-specific renderer
+            renderer = self.renderers[audience]
+            print(f"  Using {renderer.get_audience_name()} renderer")
+            html = renderer.render(context, logo_base64=self.logo_base64)
+        else:
+            # Default rendering (backward compatibility)
+            context["logo_base64"] = self.logo_base64
+            html = self.template.render(context)
+        print("✓ Template rendered")
+
+        # Step 6: Save to file if requested
+        if output_path:
+            output_path = Path(output_path)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_path.write_text(html, encoding="utf-8")
+            print(f"✓ Report saved to {output_path}")
+
+        return html
+
+    def _prepare_context(self, csv_path: str | Path) -> dict:
+        """
+        Run the data pipeline (steps 1-4.5) and return the template context.
+
+        Shared by generate() and generate_all_audiences() so multi-audience
+        runs only pay for loading/validation/transformation once.
+
+        Args:
+            csv_path: Path to CSV file with KPR data
+
+        Returns:
+            Template context dictionary ready for rendering
+
+        Raises:
+            FileNotFoundError: If CSV file doesn't exist
+            ValueError: If data validation fails catastrophically
+        """
         # Step 1: Load data
         print(f"Loading data from {csv_path}...")
         raw_data = self.loader.load(csv_path)
@@ -155,10 +215,14 @@ class KPRReportGenerator:
         print("✓ Context ready")
 
         # Step 4.5: Apply reasoning layer (if enabled)
-        from report_generator.reasoning import get_config
-
-        reasoning_config = get_config()
-        if reasoning_config.is_enabled():
+        # Cheap gate first: skip importing the reasoning subtree entirely
+        # when reasoning was never requested.
+        reasoning_config = None
+        if _reasoning_requested():
+            from report_generator.reasoning import get_config
+
+            reasoning_config = get_config()
+        if reasoning_config is not None and reasoning_config.is_enabled():
             try:
                 print("Generating AI insights...")
                 provider = reasoning_config.get_provider()
@@ -182,27 +246,71 @@ class KPRReportGenerator:
                 print(f"⚠ Warning: AI synthesis failed: {e}")
                 # Continue without synthesis - graceful degradation
 
-        # Step 5: Render template (using audience renderer if specified)
-        print("Rendering HTML template...")
-        if audience and audience in self.renderers:
-            # Use audience-specific renderer
-            renderer = self.renderers[audience]
-            print(f"  Using {renderer.get_audience_name()} renderer")
-            html = renderer.render(context, logo_base64=self.logo_base64)
-        else:
-            # Default rendering (backward compatibility)
-            context["logo_base64"] = self.logo_base64
-            html = self.template.render(context)
-        print("✓ Template rendered")
+        return context
 
-        # Step 6: Save to file if requested
-        if output_path:
-            output_path = Path(output_path)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_text(html, encoding="utf-8")
-            print(f"✓ Report saved to {output_path}")
+    def generate_all_audiences(
+        self,
+        csv_path: str | Path,
+        output_dir: str | Path,
+    ) -> dict[str, str]:
+        """
+        Generate reports for all audiences and save them concurrently.
 
-        return html
+        Runs the data pipeline once, renders each audience view, then writes
+        all output files in parallel so the save step costs roughly one
+        file's worth of wall time instead of the sum of all three.
+
+        Args:
+            csv_path: Path to CSV file with KPR data
+            output_dir: Directory to write one HTML file per audience
+                       (named {audience}.html)
+
+        Returns:
+            Dictionary mapping audience name to rendered HTML string
+
+        Example:
+            >>> generator = KPRReportGenerator()
+            >>> results = generator.generate_all_audiences("data/kpr.csv", "outputs/")
+            >>> results.keys()
+            dict_keys(['executive', 'technical', 'partner'])
+        """
+        context = self._prepare_context(csv_path)
+
+        print("Rendering HTML templates for all audiences...")
+        results = {}
+        for audience, renderer in self.renderers.items():
+            results[audience] = renderer.render(context, logo_base64=self.logo_base64)
+        print(f"✓ Rendered {len(results)} audience views")
+
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        pairs = [(output_dir / f"{audience}.html", html) for audience, html in results.items()]
+        self._save_outputs(pairs)
+        print(f"✓ Reports saved to {output_dir}")
+
+        return results
+
+    @staticmethod
+    def _save_outputs(pairs: list[tuple[Path, str]]) -> None:
+        """
+        Write (path, html) pairs to disk concurrently.
+
+        Uses a thread pool so the OS can overlap the writes instead of
+        performing each open/write/close sequence serially.
+
+        Args:
+            pairs: List of (output path, HTML string) tuples
+        """
+        if not pairs:
+            return
+
+        def _write(pair: tuple[Path, str]) -> None:
+            path, html = pair
+            path.write_text(html, encoding="utf-8")
+
+        with ThreadPoolExecutor(max_workers=len(pairs)) as executor:
+            # list() forces iteration so any write error propagates
+            list(executor.map(_write, pairs))
 
     def generate_from_data(self, data: list[dict]) -> str:
         """
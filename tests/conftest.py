@@ -0,0 +1,31 @@
+"""
+Shared pytest fixtures.
+
+Session-scoped fixtures here cache expensive setup (loader construction,
+parsing the canonical mock CSV) across the whole test run.
+"""
+
+from pathlib import Path
+from types import MappingProxyType
+
+import pytest
+
+from report_generator.data.loader import TabularDataLoader
+
+
+@pytest.fixture(scope="session")
+def loader():
+    """One TabularDataLoader shared by the whole session."""
+    return TabularDataLoader()
+
+
+@pytest.fixture(scope="session")
+def mock_csv_data(loader):
+    """Parse tests/fixtures/mock_data.csv once and share the rows."""
+    return loader.load(Path("tests/fixtures/mock_data.csv"))
+
+
+@pytest.fixture(scope="session")
+def mock_rows(mock_csv_data):
+    """Immutable snapshot of the mock rows, safe to share across tests."""
+    return tuple(MappingProxyType(row) for row in mock_csv_data)
@@ -160,6 +160,7 @@ class TestKPRPipeline:
         assert isinstance(status_name, str)
         assert isinstance(items, list)
 
+    @pytest.mark.slow
     def test_full_report_generation(self):
         """
         Test complete end-to-end report generation.
@@ -190,6 +191,7 @@ class TestKPRPipeline:
 
         print("✓ Full report generation successful")
 
+    @pytest.mark.slow
     def test_report_generation_with_file_output(self, tmp_path):
         """
         Test report generation with file output.
@@ -214,6 +216,31 @@ class TestKPRPipeline:
 
         print(f"✓ Report saved to {output_path}")
 
+    @pytest.mark.slow
+    def test_generate_all_audiences(self, tmp_path):
+        """
+        Test multi-audience generation saves one file per audience.
+
+        Should render executive, technical, and partner views from one
+        pipeline run and write all three HTML files.
+        """
+        from report_generator.reports.example_report.generator import KPRReportGenerator
+
+        generator = KPRReportGenerator()
+        csv_path = Path("tests/fixtures/mock_data.csv")
+        output_dir = tmp_path / "reports"
+
+        results = generator.generate_all_audiences(csv_path, output_dir)
+
+        # One rendered view per registered renderer
+        assert set(results.keys()) == {"executive", "technical", "partner"}
+
+        # Each view saved to its own file with matching content
+        for audience, html in results.items():
+            output_path = output_dir / f"{audience}.html"
+            assert output_path.exists()
+            assert output_path.read_text(encoding="utf-8") == html
+
     def test_generator_without_logo(self, tmp_path):
         """
         Test that generator works when logo file doesn't exist.
@@ -236,7 +263,7 @@ class TestKPRPipeline:
             generator = KPRReportGenerator()
             assert generator.logo_base64 == ""
 
-    def test_generator_validation_failure(self):
+    def test_generator_validation_failure(self, tmp_path):
         """
         Test that generator raises ValueError on validation failure.
 
@@ -247,7 +274,7 @@ class TestKPRPipeline:
         from report_generator.reports.example_report.generator import KPRReportGenerator
 
         # Create a valid CSV that will load successfully
-        valid_csv = Path("tests/fixtures/valid_for_validation_test.csv")
+        valid_csv = tmp_path / "valid_for_validation_test.csv"
         valid_csv.write_text(
             "Initiatives (L3),L4 Deliverables,Deliverable Status,Event Phase,L4 Priority,"
             "Delivery Date,Risks & Issues,Key Achievements,Program Workstream Lead,"
@@ -273,10 +300,7 @@ class TestKPRPipeline:
 
             assert "validation failed" in str(exc_info.value).lower()
 
-        # Cleanup
-        valid_csv.unlink()
-
-    def test_generator_with_validation_warnings(self, capsys):
+    def test_generator_with_validation_warnings(self, capsys, tmp_path):
         """
         Test that generator continues when validation has warnings.
 
@@ -287,7 +311,7 @@ class TestKPRPipeline:
         from report_generator.reports.example_report.generator import KPRReportGenerator
 
         # Create CSV with valid data
-        warning_csv = Path("tests/fixtures/warning_test.csv")
+        warning_csv = tmp_path / "warning_test.csv"
         warning_csv.write_text(
             "Initiatives (L3),L4 Deliverables,Deliverable Status,Event Phase,L4 Priority,"
             "Delivery Date,Risks & Issues,Key Achievements,Program Workstream Lead,"
@@ -319,9 +343,6 @@ class TestKPRPipeline:
         assert "Warnings" in captured.out
         assert "Test warning message" in captured.out
 
-        # Cleanup
-        warning_csv.unlink()
-
     def test_generate_from_data_method(self):
         """
         Test the generate_from_data method.
@@ -0,0 +1,26 @@
+"""
+Lightweight test doubles shared by unit tests.
+
+These avoid unittest.mock's per-access descriptor machinery and call
+recording where a test only needs canned behavior. Tests that assert on
+call_args/call_count should keep using Mock.
+"""
+
+
+class FakeProvider:
+    """
+    Minimal LLMProvider stand-in returning canned responses in order.
+    """
+
+    def __init__(self, responses=("Summary",), model="test"):
+        self.model = model
+        self._responses = iter(responses)
+
+    def generate(self, **kwargs):
+        return next(self._responses)
+
+    def get_token_usage(self):
+        return {"input_tokens": 0, "output_tokens": 0, "cache_read_input_tokens": 0}
+
+    def reset_token_usage(self):
+        pass
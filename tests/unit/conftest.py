@@ -0,0 +1,11 @@
+"""
+Fixtures shared by the unit test suite.
+"""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch):
+    """Neutralize time.sleep so retry backoff never blocks a unit test."""
+    monkeypatch.setattr("time.sleep", lambda *_: None)
@@ -4,59 +4,163 @@ Unit tests for action items prompt generation.
 Tests the prompt building and response parsing for AI-generated action items.
 """
 
-import json
+import re
 
 import pytest
 
 from report_generator.reasoning.prompts import action_items
 
+try:
+    # Optional C-accelerated encoder; only the test payload build uses it.
+    # Production parse_response stays on stdlib json. Payloads are bytes
+    # either way, exercising the bytes-accepting parse_response contract.
+    import orjson
+
+    _dumps = orjson.dumps
+
+except ImportError:  # pragma: no cover - depends on environment
+    from json import dumps as _json_dumps
+
+    def _dumps(obj):
+        return _json_dumps(obj).encode()
+
+
+# Context with critical (Off Track / At Risk) deliverables shared by the
+# prompt-building tests below
+CRITICAL_CTX = {
+    "total_deliverables": 3,
+    "status_groups": [
+        ("Off Track", [{"name": "API"}]),
+        ("At Risk", [{"name": "Database"}]),
+        ("On Track", [{"name": "Frontend"}]),
+    ],
+    "deliverables": [
+        {
+            "deliverable": "API Upgrade",
+            "status": "Off Track",
+            "lead": "Alice",
+            "risks_issues": "Team understaffed",
+            "next_steps": "Hire 2 engineers",
+        },
+        {
+            "deliverable": "Database Migration",
+            "status": "At Risk",
+            "lead": "Bob",
+            "risks_issues": "Delayed by 2 weeks",
+            "next_steps": "Expedite vendor approval",
+        },
+        {
+            "deliverable": "Frontend Redesign",
+            "status": "On Track",
+            "lead": "Carol",
+            "risks_issues": "None",
+            "next_steps": "Continue development",
+        },
+    ],
+}
+
+
+# Details the critical-deliverables prompt must contain, checked with a
+# single alternation scan instead of one pass per substring
+_CRITICAL_NEEDLES = (
+    "API Upgrade",
+    "Database Migration",
+    "Team understaffed",
+    "Delayed by 2 weeks",
+    "JSON",  # Should include output format
+)
+_CRITICAL_RE = re.compile("|".join(map(re.escape, _CRITICAL_NEEDLES)))
+
+
+@pytest.fixture(scope="module")
+def critical_prompt():
+    """Build the critical-deliverables prompt once for the whole module."""
+    return action_items.build_prompt(CRITICAL_CTX)
+
+
+# Response payloads serialized once at import instead of per test
+_VALID_RESPONSE = _dumps(
+    {
+        "actions": [
+            {
+                "title": "Hire additional engineers for API team",
+                "description": "Prioritize hiring 2 senior engineers to address understaffing",
+                "owner": "Alice",
+                "success_criterion": "Team at full capacity within 30 days",
+                "confidence": "high",
+                "related_deliverables": ["API Upgrade"],
+            },
+            {
+                "title": "Expedite vendor approval process",
+                "description": "Work with procurement to fast-track database vendor selection",
+                "owner": "Bob",
+                "success_criterion": "Vendor approved within 1 week",
+                "confidence": "medium",
+                "related_deliverables": ["Database Migration"],
+            },
+        ]
+    }
+)
+
+_MISSING_ACTIONS_RESPONSE = _dumps({"results": []})
+
+_ACTIONS_NOT_LIST_RESPONSE = _dumps({"actions": "not a list"})
+
+_MISSING_FIELDS_RESPONSE = _dumps(
+    {
+        "actions": [
+            {
+                "title": "Test",
+                "description": "Test",
+                # Missing: owner, success_criterion, confidence
+            }
+        ]
+    }
+)
+
+_INVALID_CONFIDENCE_RESPONSE = _dumps(
+    {
+        "actions": [
+            {
+                "title": "Test",
+                "description": "Test",
+                "owner": "Test",
+                "success_criterion": "Test",
+                "confidence": "super-high",  # Invalid
+                "related_deliverables": [],
+            }
+        ]
+    }
+)
+
+_OPTIONAL_FIELDS_RESPONSE = _dumps(
+    {
+        "actions": [
+            {
+                "title": "Test action",
+                "description": "Test description",
+                "owner": "Test Owner",
+                "success_criterion": "Test criterion",
+                "confidence": "low",
+                # related_deliverables is optional
+            }
+        ]
+    }
+)
+
 
 class TestActionItemsPrompt:
     """Tests for action items prompt building."""
 
-    def test_build_prompt_with_critical_deliverables(self):
-        """Test prompt generation with critical deliverables."""
-        context = {
-            "total_deliverables": 3,
-            "status_groups": [
-                ("Off Track", [{"name": "API"}]),
-                ("At Risk", [{"name": "Database"}]),
-                ("On Track", [{"name": "Frontend"}]),
-            ],
-            "deliverables": [
-                {
-                    "deliverable": "API Upgrade",
-                    "status": "Off Track",
-                    "lead": "Alice",
-                    "risks_issues": "Team understaffed",
-                    "next_steps": "Hire 2 engineers",
-                },
-                {
-                    "deliverable": "Database Migration",
-                    "status": "At Risk",
-                    "lead": "Bob",
-                    "risks_issues": "Delayed by 2 weeks",
-                    "next_steps": "Expedite vendor approval",
-                },
-                {
-                    "deliverable": "Frontend Redesign",
-                    "status": "On Track",
-                    "lead": "Carol",
-                    "risks_issues": "None",
-                    "next_steps": "Continue development",
-                },
-            ],
-        }
-
-        prompt = action_items.build_prompt(context)
+    def test_build_prompt_with_critical_deliverables(self, critical_prompt):
+        """Test prompt generation includes every critical deliverable detail."""
+        assert critical_prompt is not None
+        found = set(_CRITICAL_RE.findall(critical_prompt))
+        assert found == set(_CRITICAL_NEEDLES)
 
-        assert prompt is not None
-        assert "API Upgrade" in prompt
-        assert "Database Migration" in prompt
-        assert "Frontend Redesign" not in prompt  # On Track items excluded
-        assert "Team understaffed" in prompt
-        assert "Delayed by 2 weeks" in prompt
-        assert "JSON" in prompt  # Should include output format
+    def test_build_prompt_excludes_on_track_items(self, critical_prompt):
+        """Test that On Track deliverables are excluded from the prompt."""
+        assert "Frontend Redesign" not in critical_prompt
 
     def test_build_prompt_with_no_critical_items(self):
         """Test that no prompt is generated when all items are on track."""
@@ -97,27 +201,12 @@ class TestActionItemsPrompt:
 
         assert prompt is None  # No actions needed
 
-    def test_build_prompt_includes_confidence_instructions(self):
+    def test_build_prompt_includes_confidence_instructions(self, critical_prompt):
         """Test that prompt includes confidence level instructions."""
-        context = {
-            "total_deliverables": 1,
-            "deliverables": [
-                {
-                    "deliverable": "API",
-                    "status": "Off Track",
-                    "lead": "Alice",
-                    "risks_issues": "Issue",
-                    "next_steps": "Fix",
-                },
-            ],
-        }
-
-        prompt = action_items.build_prompt(context)
-
-        assert "confidence" in prompt.lower()
-        assert "high" in prompt
-        assert "medium" in prompt
-        assert "low" in prompt
+        assert "confidence" in critical_prompt.lower()
+        assert "high" in critical_prompt
+        assert "medium" in critical_prompt
+        assert "low" in critical_prompt
 
 
 class TestActionItemsResponseParsing:
@@ -125,30 +214,7 @@ class TestActionItemsResponseParsing:
 
     def test_parse_valid_response(self):
         """Test parsing valid JSON response."""
-        response = json.dumps(
-            {
-                "actions": [
-                    {
-                        "title": "Hire additional engineers for API team",
-                        "description": "Prioritize hiring 2 senior engineers to address understaffing",
-                        "owner": "Alice",
-                        "success_criterion": "Team at full capacity within 30 days",
-                        "confidence": "high",
-                        "related_deliverables": ["API Upgrade"],
-                    },
-                    {
-                        "title": "Expedite vendor approval process",
-                        "description": "Work with procurement to fast-track database vendor selection",
-                        "owner": "Bob",
-                        "success_criterion": "Vendor approved within 1 week",
-                        "confidence": "medium",
-                        "related_deliverables": ["Database Migration"],
-                    },
-                ]
-            }
-        )
-
-        result = action_items.parse_response(response)
+        result = action_items.parse_response(_VALID_RESPONSE)
 
         assert "actions" in result
         assert "count" in result
@@ -182,54 +248,23 @@ class TestActionItemsResponseParsing:
 
     def test_parse_response_missing_actions_field(self):
         """Test error handling when actions field is missing."""
-        response = json.dumps({"results": []})
-
         with pytest.raises(ValueError, match="missing 'actions' field"):
-            action_items.parse_response(response)
+            action_items.parse_response(_MISSING_ACTIONS_RESPONSE)
 
     def test_parse_response_actions_not_list(self):
         """Test error handling when actions is not a list."""
-        response = json.dumps({"actions": "not a list"})
-
         with pytest.raises(ValueError, match="'actions' must be a list"):
-            action_items.parse_response(response)
+            action_items.parse_response(_ACTIONS_NOT_LIST_RESPONSE)
 
     def test_parse_response_missing_required_fields(self):
         """Test error handling when action is missing required fields."""
-        response = json.dumps(
-            {
-                "actions": [
-                    {
-                        "title": "Test",
-                        "description": "Test",
-                        # Missing: owner, success_criterion, confidence
-                    }
-                ]
-            }
-        )
-
         with pytest.raises(ValueError, match="missing required field"):
-            action_items.parse_response(response)
+            action_items.parse_response(_MISSING_FIELDS_RESPONSE)
 
     def test_parse_response_invalid_confidence(self):
         """Test error handling for invalid confidence level."""
-        response = json.dumps(
-            {
-                "actions": [
-                    {
-                        "title": "Test",
-                        "description": "Test",
-                        "owner": "Test",
-                        "success_criterion": "Test",
-                        "confidence": "super-high",  # Invalid
-                        "related_deliverables": [],
-                    }
-                ]
-            }
-        )
-
         with pytest.raises(ValueError, match="invalid confidence"):
-            action_items.parse_response(response)
+            action_items.parse_response(_INVALID_CONFIDENCE_RESPONSE)
 
     def test_parse_response_invalid_json(self):
         """Test error handling for invalid JSON."""
@@ -240,22 +275,7 @@ class TestActionItemsResponseParsing:
 
     def test_parse_response_with_optional_fields(self):
         """Test that related_deliverables is optional."""
-        response = json.dumps(
-            {
-                "actions": [
-                    {
-                        "title": "Test action",
-                        "description": "Test description",
-                        "owner": "Test Owner",
-                        "success_criterion": "Test criterion",
-                        "confidence": "low",
-                        # related_deliverables is optional
-                    }
-                ]
-            }
-        )
-
-        result = action_items.parse_response(response)
+        result = action_items.parse_response(_OPTIONAL_FIELDS_RESPONSE)
 
         assert result["count"] == 1
         # Should not raise error even without related_deliverables
@@ -7,28 +7,31 @@ renders correctly with context data.
 This is KPR-specific. Other reports will have their own template tests.
 """
 
+from importlib.resources import files
 from pathlib import Path
 
 import pytest
-from jinja2 import Environment, FileSystemLoader
 
+from report_generator.output.renderers import get_environment
 from report_generator.reports.example_report.builder import KPRReportBuilder
 
 
+@pytest.fixture(scope="session")
+def template():
+    """Compile the KPR template once for the whole test session."""
+    template_dir = Path(str(files("report_generator.reports").joinpath("example_report")))
+    return get_environment(template_dir).get_template("template.html")
+
+
 class TestTemplateRendering:
     """Tests for KPR template rendering."""
 
-    def test_template_renders_without_error(self):
+    def test_template_renders_without_error(self, template):
         """
         Test that template renders with minimal context.
 
         Should not raise any Jinja2 errors.
         """
-        # Setup Jinja2 environment
-        template_dir = Path("src/report_generator/reports/example_report")
-        env = Environment(loader=FileSystemLoader(template_dir))
-        template = env.get_template("template.html")
-
         # Minimal context
         builder = KPRReportBuilder()
         context = builder.build_context([])
@@ -40,17 +43,12 @@ class TestTemplateRendering:
         assert len(html) > 0
         assert "<!DOCTYPE html>" in html
 
-    def test_template_renders_with_data(self):
+    def test_template_renders_with_data(self, template):
         """
         Test that template renders with actual data.
 
         Should include deliverable names, status, etc.
         """
-        # Setup template
-        template_dir = Path("src/report_generator/reports/example_report")
-        env = Environment(loader=FileSystemLoader(template_dir))
-        template = env.get_template("template.html")
-
         # Sample data
         data = [
             {
@@ -84,17 +82,12 @@ class TestTemplateRendering:
         assert "Alice" in html
         assert "Carol" in html
 
-    def test_template_handles_empty_values(self):
+    def test_template_handles_empty_values(self, template):
         """
         Test that template handles empty/missing values gracefully.
 
         Should display empty state messages from config.
         """
-        # Setup template
-        template_dir = Path("src/report_generator/reports/example_report")
-        env = Environment(loader=FileSystemLoader(template_dir))
-        template = env.get_template("template.html")
-
         # Data with empty values
         data = [
             {
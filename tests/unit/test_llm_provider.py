@@ -4,143 +4,229 @@ Unit tests for LLM provider implementations.
 These tests use mocking to avoid actual API calls.
 """
 
-import os
-from unittest.mock import Mock, patch
+import re
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
 from report_generator.reasoning.provider import AnthropicProvider, LLMProviderError, OpenAIProvider
 
+# Provider error messages, compiled once. pytest.raises(match=...) accepts
+# Pattern objects, and the constants keep the tests in sync with provider.py.
+ERR_API_KEY = re.compile("API key is required")
+ERR_EMPTY_PROMPT = re.compile("Prompt cannot be empty")
+ERR_MAX_TOKENS = re.compile("max_tokens must be positive")
+ERR_TEMPERATURE = re.compile("temperature must be between")
+
+
+@pytest.fixture
+def anthropic_mock():
+    """Patch anthropic.Anthropic once per test instead of per with-block."""
+    patcher = patch("anthropic.Anthropic")
+    mock = patcher.start()
+    yield mock
+    patcher.stop()
+
+
+@pytest.fixture
+def anthropic_response():
+    """Factory for API response stubs; attribute-only, so no Mock needed."""
+
+    def _make(text="Generated summary", input_tokens=100, output_tokens=50):
+        return SimpleNamespace(
+            content=[SimpleNamespace(text=text)],
+            usage=SimpleNamespace(input_tokens=input_tokens, output_tokens=output_tokens),
+        )
+
+    return _make
+
+
+@pytest.fixture
+def provider(anthropic_mock, anthropic_response):
+    """Provider wired to a mocked client returning a default response."""
+    anthropic_mock.return_value.messages.create.return_value = anthropic_response()
+    return AnthropicProvider(api_key="test-key")
+
 
 class TestAnthropicProvider:
     """Tests for AnthropicProvider."""
 
-    def test_init_with_api_key(self):
+    def test_init_with_api_key(self, anthropic_mock):
         """Test initialization with explicit API key."""
-        with patch("anthropic.Anthropic"):
-            provider = AnthropicProvider(api_key="test-key-123")
-            assert provider.api_key == "test-key-123"
-            assert provider.model == AnthropicProvider.DEFAULT_MODEL
+        provider = AnthropicProvider(api_key="test-key-123")
+        assert provider.api_key == "test-key-123"
+        assert provider.model == AnthropicProvider.DEFAULT_MODEL
 
-    def test_init_with_env_var(self):
+    def test_init_with_env_var(self, anthropic_mock, monkeypatch):
         """Test initialization using environment variable."""
-        with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "env-key-456"}):
-            with patch("anthropic.Anthropic"):
-                provider = AnthropicProvider()
-                assert provider.api_key == "env-key-456"
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "env-key-456")
+        provider = AnthropicProvider()
+        assert provider.api_key == "env-key-456"
 
-    def test_init_missing_api_key(self):
+    def test_init_missing_api_key(self, monkeypatch):
         """Test that initialization fails without API key."""
-        with patch.dict(os.environ, {}, clear=True):
-            with pytest.raises(ValueError, match="API key is required"):
-                AnthropicProvider()
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        with pytest.raises(ValueError, match=ERR_API_KEY):
+            AnthropicProvider()
 
-    def test_init_custom_model(self):
+    def test_init_custom_model(self, anthropic_mock):
         """Test initialization with custom model."""
-        with patch("anthropic.Anthropic"):
-            provider = AnthropicProvider(api_key="test-key", model="claude-opus-4")
-            assert provider.model == "claude-opus-4"
+        provider = AnthropicProvider(api_key="test-key", model="claude-opus-4")
+        assert provider.model == "claude-opus-4"
+
+    def test_init_with_http_client(self, anthropic_mock):
+        """Test that a shared httpx client is passed through to the SDK."""
+        http_client = object()
+        AnthropicProvider(api_key="test-key", http_client=http_client)
 
-    def test_generate_success(self):
+        assert anthropic_mock.call_args.kwargs["http_client"] is http_client
+
+    def test_context_manager_closes_client(self, anthropic_mock):
+        """Test that the provider closes its HTTP client on exit."""
+        with AnthropicProvider(api_key="test-key") as provider:
+            pass
+
+        provider.client.close.assert_called_once()
+
+    def test_generate_success(self, provider):
         """Test successful text generation."""
-        mock_response = Mock()
-        mock_response.content = [Mock(text="Generated summary")]
-        mock_response.usage = Mock(input_tokens=100, output_tokens=50)
+        result = provider.generate("Summarize this", max_tokens=500)
+
+        assert result == "Generated summary"
+        assert provider.get_token_usage() == {
+            "input_tokens": 100,
+            "output_tokens": 50,
+            "cache_read_input_tokens": 0,
+        }
+
+    def test_generate_marks_system_prompt_cacheable(self, provider, anthropic_mock):
+        """Test that the system prompt is sent as an ephemeral-cached block."""
+        provider.generate("Summarize this", system_prompt="You are a helpful assistant.")
+
+        call_args = anthropic_mock.return_value.messages.create.call_args
+        system = call_args.kwargs["system"]
+
+        assert system[0]["text"] == "You are a helpful assistant."
+        assert system[0]["cache_control"]["type"] == "ephemeral"
+
+    def test_generate_batch_submits_single_job(self, provider, anthropic_mock):
+        """Test that generate_batch submits one batch and restores order."""
+
+        def batch_result(custom_id, text):
+            return SimpleNamespace(
+                custom_id=custom_id,
+                result=SimpleNamespace(
+                    type="succeeded",
+                    message=SimpleNamespace(
+                        content=[SimpleNamespace(text=text)],
+                        usage=SimpleNamespace(input_tokens=10, output_tokens=5),
+                    ),
+                ),
+            )
+
+        batches = anthropic_mock.return_value.messages.batches
+        batches.create.return_value = SimpleNamespace(id="batch_1", processing_status="ended")
+        # Results arrive in completion order, not request order
+        batches.results.return_value = [
+            batch_result("1", "Second"),
+            batch_result("0", "First"),
+        ]
 
-        with patch("anthropic.Anthropic") as mock_anthropic:
-            mock_client = Mock()
-            mock_client.messages.create.return_value = mock_response
-            mock_anthropic.return_value = mock_client
+        responses = provider.generate_batch(
+            [{"prompt": "one"}, {"prompt": "two", "system_prompt": "Be brief."}]
+        )
+
+        assert responses == ["First", "Second"]
+        batches.create.assert_called_once()
+        submitted = batches.create.call_args.kwargs["requests"]
+        assert len(submitted) == 2
+        assert submitted[1]["params"]["system"][0]["text"] == "Be brief."
+        assert provider.get_token_usage()["input_tokens"] == 20
+
+    def test_stream_generate_yields_chunks(self, provider, anthropic_mock):
+        """Test that stream_generate yields text chunks and tracks usage."""
+        final_message = SimpleNamespace(usage=SimpleNamespace(input_tokens=30, output_tokens=12))
+        stream_cm = anthropic_mock.return_value.messages.stream.return_value
+        stream_cm.__enter__.return_value = SimpleNamespace(
+            text_stream=["Gen", "erated ", "summary"],
+            get_final_message=lambda: final_message,
+        )
+
+        chunks = list(provider.stream_generate("Summarize this", system_prompt="Be brief."))
+
+        assert chunks == ["Gen", "erated ", "summary"]
+        usage = provider.get_token_usage()
+        assert usage["input_tokens"] == 30
+        assert usage["output_tokens"] == 12
+
+    def test_generate_batch_marks_failed_entries(self, provider, anthropic_mock):
+        """Test that failed batch entries come back as None."""
+        batches = anthropic_mock.return_value.messages.batches
+        batches.create.return_value = SimpleNamespace(id="batch_1", processing_status="ended")
+        batches.results.return_value = [
+            SimpleNamespace(custom_id="0", result=SimpleNamespace(type="errored")),
+        ]
 
-            provider = AnthropicProvider(api_key="test-key")
-            result = provider.generate("Summarize this", max_tokens=500)
+        responses = provider.generate_batch([{"prompt": "one"}])
 
-            assert result == "Generated summary"
-            assert provider.get_token_usage() == {"input_tokens": 100, "output_tokens": 50}
+        assert responses == [None]
 
-    def test_generate_empty_prompt(self):
+    def test_generate_empty_prompt(self, provider):
         """Test that empty prompt raises error."""
-        with patch("anthropic.Anthropic"):
-            provider = AnthropicProvider(api_key="test-key")
-            with pytest.raises(ValueError, match="Prompt cannot be empty"):
-                provider.generate("")
+        with pytest.raises(ValueError, match=ERR_EMPTY_PROMPT):
+            provider.generate("")
 
-    def test_generate_invalid_max_tokens(self):
+    def test_generate_invalid_max_tokens(self, provider):
         """Test that invalid max_tokens raises error."""
-        with patch("anthropic.Anthropic"):
-            provider = AnthropicProvider(api_key="test-key")
-            with pytest.raises(ValueError, match="max_tokens must be positive"):
-                provider.generate("test", max_tokens=0)
+        with pytest.raises(ValueError, match=ERR_MAX_TOKENS):
+            provider.generate("test", max_tokens=0)
 
-    def test_generate_invalid_temperature(self):
+    def test_generate_invalid_temperature(self, provider):
         """Test that invalid temperature raises error."""
-        with patch("anthropic.Anthropic"):
-            provider = AnthropicProvider(api_key="test-key")
-            with pytest.raises(ValueError, match="temperature must be between"):
-                provider.generate("test", temperature=-0.1)
+        with pytest.raises(ValueError, match=ERR_TEMPERATURE):
+            provider.generate("test", temperature=-0.1)
 
-    def test_generate_with_retries(self):
+    def test_generate_with_retries(self, anthropic_mock, anthropic_response):
         """Test that provider retries on transient failures."""
-        mock_response = Mock()
-        mock_response.content = [Mock(text="Success after retries")]
-        mock_response.usage = Mock(input_tokens=100, output_tokens=50)
-
-        with patch("anthropic.Anthropic") as mock_anthropic:
-            mock_client = Mock()
-            mock_client.messages.create.side_effect = [
-                Exception("Network error"),
-                Exception("Rate limit"),
-                mock_response,
-            ]
-            mock_anthropic.return_value = mock_client
-
-            with patch("time.sleep"):
-                provider = AnthropicProvider(api_key="test-key", max_retries=3)
-                result = provider.generate("test prompt")
-
-                assert result == "Success after retries"
-                assert mock_client.messages.create.call_count == 3
-
-    def test_token_usage_accumulation(self):
-        """Test that token usage accumulates."""
-        responses = [
-            Mock(content=[Mock(text="First")], usage=Mock(input_tokens=50, output_tokens=25)),
-            Mock(content=[Mock(text="Second")], usage=Mock(input_tokens=75, output_tokens=30)),
+        mock_create = anthropic_mock.return_value.messages.create
+        mock_create.side_effect = [
+            Exception("Network error"),
+            Exception("Rate limit"),
+            anthropic_response(text="Success after retries"),
         ]
 
-        with patch("anthropic.Anthropic") as mock_anthropic:
-            mock_client = Mock()
-            mock_client.messages.create.side_effect = responses
-            mock_anthropic.return_value = mock_client
+        provider = AnthropicProvider(api_key="test-key", max_retries=3)
+        result = provider.generate("test prompt")
 
-            provider = AnthropicProvider(api_key="test-key")
-            provider.generate("First")
-            provider.generate("Second")
+        assert result == "Success after retries"
+        assert mock_create.call_count == 3
 
-            usage = provider.get_token_usage()
-            assert usage["input_tokens"] == 125
-            assert usage["output_tokens"] == 55
+    def test_token_usage_accumulation(self, anthropic_mock, anthropic_response):
+        """Test that token usage accumulates."""
+        anthropic_mock.return_value.messages.create.side_effect = [
+            anthropic_response(text="First", input_tokens=50, output_tokens=25),
+            anthropic_response(text="Second", input_tokens=75, output_tokens=30),
+        ]
 
-    def test_reset_token_usage(self):
-        """Test that token usage can be reset."""
-        mock_response = Mock()
-        mock_response.content = [Mock(text="Response")]
-        mock_response.usage = Mock(input_tokens=100, output_tokens=50)
+        provider = AnthropicProvider(api_key="test-key")
+        provider.generate("First")
+        provider.generate("Second")
 
-        with patch("anthropic.Anthropic") as mock_anthropic:
-            mock_client = Mock()
-            mock_client.messages.create.return_value = mock_response
-            mock_anthropic.return_value = mock_client
+        usage = provider.get_token_usage()
+        assert usage["input_tokens"] == 125
+        assert usage["output_tokens"] == 55
 
-            provider = AnthropicProvider(api_key="test-key")
-            provider.generate("test")
+    def test_reset_token_usage(self, provider):
+        """Test that token usage can be reset."""
+        provider.generate("test")
 
-            assert provider.get_token_usage()["input_tokens"] == 100
+        assert provider.get_token_usage()["input_tokens"] == 100
 
-            provider.reset_token_usage()
-            usage = provider.get_token_usage()
-            assert usage["input_tokens"] == 0
-            assert usage["output_tokens"] == 0
+        provider.reset_token_usage()
+        usage = provider.get_token_usage()
+        assert usage["input_tokens"] == 0
+        assert usage["output_tokens"] == 0
 
 
 class TestOpenAIProvider:
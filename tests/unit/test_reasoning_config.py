@@ -2,7 +2,6 @@
 Unit tests for reasoning configuration.
 """
 
-import os
 from unittest.mock import patch
 
 import pytest
@@ -10,6 +9,13 @@ import pytest
 from report_generator.reasoning.config import ReasoningConfig, get_config, reset_config
 
 
+@pytest.fixture(autouse=True)
+def _reset_global_config():
+    """Reset the global config singleton after every test in this module."""
+    yield
+    reset_config()
+
+
 class TestReasoningConfig:
     """Tests for ReasoningConfig."""
 
@@ -30,70 +36,70 @@ class TestReasoningConfig:
         config = ReasoningConfig(enabled=False)
         assert config.is_enabled() is False
 
-    def test_enabled_from_env_true(self):
+    @pytest.mark.parametrize("value", ["true", "1", "yes", "on", "TRUE", "ON"])
+    def test_enabled_from_env_true(self, value, monkeypatch):
         """Test reading enabled flag from environment (true values)."""
-        for value in ["true", "1", "yes", "on", "TRUE", "ON"]:
-            with patch.dict(os.environ, {"ENABLE_REASONING": value}):
-                config = ReasoningConfig()
-                assert config.is_enabled() is True
+        monkeypatch.setenv("ENABLE_REASONING", value)
+        config = ReasoningConfig()
+        assert config.is_enabled() is True
 
-    def test_enabled_from_env_false(self):
+    @pytest.mark.parametrize("value", ["false", "0", "no", "off", "FALSE", "OFF"])
+    def test_enabled_from_env_false(self, value, monkeypatch):
         """Test reading enabled flag from environment (false values)."""
-        for value in ["false", "0", "no", "off", "FALSE", "OFF"]:
-            with patch.dict(os.environ, {"ENABLE_REASONING": value}):
-                config = ReasoningConfig()
-                assert config.is_enabled() is False
+        monkeypatch.setenv("ENABLE_REASONING", value)
+        config = ReasoningConfig()
+        assert config.is_enabled() is False
 
-    def test_enabled_from_env_invalid(self):
+    def test_enabled_from_env_invalid(self, monkeypatch):
         """Test that invalid env values use default."""
-        with patch.dict(os.environ, {"ENABLE_REASONING": "maybe"}):
-            config = ReasoningConfig()
-            assert config.is_enabled() is False  # Default
+        monkeypatch.setenv("ENABLE_REASONING", "maybe")
+        config = ReasoningConfig()
+        assert config.is_enabled() is False  # Default
 
     def test_provider_selection(self):
         """Test provider selection."""
         config = ReasoningConfig(provider="openai")
         assert config.get_provider_name() == "openai"
 
-    def test_provider_from_env(self):
+    def test_provider_from_env(self, monkeypatch):
         """Test provider selection from environment."""
-        with patch.dict(os.environ, {"REASONING_PROVIDER": "openai"}):
-            config = ReasoningConfig()
-            assert config.get_provider_name() == "openai"
+        monkeypatch.setenv("REASONING_PROVIDER", "openai")
+        config = ReasoningConfig()
+        assert config.get_provider_name() == "openai"
 
     def test_max_tokens_explicit(self):
         """Test explicit max_tokens parameter."""
         config = ReasoningConfig(max_tokens=1000)
         assert config.max_tokens == 1000
 
-    def test_max_tokens_from_env(self):
+    def test_max_tokens_from_env(self, monkeypatch):
         """Test max_tokens from environment."""
-        with patch.dict(os.environ, {"REASONING_MAX_TOKENS": "4096"}):
-            config = ReasoningConfig()
-            assert config.max_tokens == 4096
+        monkeypatch.setenv("REASONING_MAX_TOKENS", "4096")
+        config = ReasoningConfig()
+        assert config.max_tokens == 4096
 
-    def test_max_tokens_invalid_env(self):
+    def test_max_tokens_invalid_env(self, monkeypatch):
         """Test that invalid max_tokens env uses default."""
-        with patch.dict(os.environ, {"REASONING_MAX_TOKENS": "not-a-number"}):
-            config = ReasoningConfig()
-            assert config.max_tokens == 2048  # Default
+        monkeypatch.setenv("REASONING_MAX_TOKENS", "not-a-number")
+        config = ReasoningConfig()
+        assert config.max_tokens == 2048  # Default
 
     def test_temperature_explicit(self):
         """Test explicit temperature parameter."""
         config = ReasoningConfig(temperature=0.7)
         assert config.temperature == 0.7
 
-    def test_temperature_from_env(self):
+    def test_temperature_from_env(self, monkeypatch):
         """Test temperature from environment."""
-        with patch.dict(os.environ, {"REASONING_TEMPERATURE": "0.5"}):
-            config = ReasoningConfig()
-            assert config.temperature == 0.5
+        monkeypatch.setenv("REASONING_TEMPERATURE", "0.5")
+        config = ReasoningConfig()
+        assert config.temperature == 0.5
 
-    def test_temperature_invalid_env(self):
+    def test_temperature_invalid_env(self, monkeypatch):
         """Test that invalid temperature env uses default."""
-        with patch.dict(os.environ, {"REASONING_TEMPERATURE": "high"}):
-            config = ReasoningConfig()
-            assert config.temperature == 0.0  # Default
+        monkeypatch.setenv("REASONING_TEMPERATURE", "high")
+        config = ReasoningConfig()
+        assert config.temperature == 0.0  # Default
 
     def test_get_provider_disabled(self):
         """Test that get_provider raises error when disabled."""
@@ -102,16 +108,16 @@ class TestReasoningConfig:
         with pytest.raises(ValueError, match="Reasoning layer is not enabled"):
             config.get_provider()
 
-    def test_get_provider_anthropic(self):
+    def test_get_provider_anthropic(self, monkeypatch):
         """Test getting Anthropic provider."""
-        with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"}):
-            with patch("anthropic.Anthropic"):
-                config = ReasoningConfig(enabled=True, provider="anthropic")
-                provider = config.get_provider()
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+        with patch("anthropic.Anthropic"):
+            config = ReasoningConfig(enabled=True, provider="anthropic")
+            provider = config.get_provider()
 
-                from report_generator.reasoning.provider import AnthropicProvider
+            from report_generator.reasoning.provider import AnthropicProvider
 
-                assert isinstance(provider, AnthropicProvider)
+            assert isinstance(provider, AnthropicProvider)
 
     def test_get_provider_unsupported(self):
         """Test that unsupported provider raises error."""
@@ -131,10 +137,6 @@ class TestReasoningConfig:
 class TestGlobalConfig:
     """Tests for global config management."""
 
-    def teardown_method(self):
-        """Reset global config after each test."""
-        reset_config()
-
     def test_get_config_default(self):
         """Test that get_config returns default config."""
         config = get_config()
@@ -2,38 +2,83 @@
 Unit tests for risk analysis prompt generation.
 """
 
-from report_generator.reasoning.prompts import risk_analysis
+import pytest
+
+from report_generator.reasoning.prompts.risk_analysis import (
+    _extract_risks,
+    _format_risks,
+    build_prompt,
+    parse_response,
+)
+
+# Module constants: contexts and canned responses are static, so build the
+# literals once instead of per test.
+CONTEXT_WITH_RISKS = {
+    "status_groups": [
+        (
+            "At Risk",
+            [
+                {
+                    "deliverable": "Feature A",
+                    "risks_issues": "Resource constraints impacting delivery",
+                }
+            ],
+        ),
+        (
+            "Off Track",
+            [
+                {
+                    "deliverable": "Feature B",
+                    "risks_issues": "Dependency delays from Team C",
+                }
+            ],
+        ),
+    ]
+}
+
+VALID_JSON_RESPONSE = """{
+    "themes": [
+        {
+            "name": "Resource Constraints",
+            "description": "Multiple teams facing staffing issues",
+            "affected_deliverables": ["Feature A", "Feature B"],
+            "severity": "high"
+        }
+    ],
+    "critical_risks": [
+        {
+            "deliverable": "Feature A",
+            "risk": "Team understaffed",
+            "reason": "Impacts launch timeline"
+        }
+    ],
+    "anomalies": [
+        {
+            "deliverable": "Feature C",
+            "issue": "Marked On Track but has major risks"
+        }
+    ]
+}"""
+
+
+@pytest.fixture(scope="module")
+def sample_prompt():
+    """Build the canonical risky-context prompt once per module."""
+    return build_prompt(CONTEXT_WITH_RISKS)
+
+
+@pytest.fixture(scope="module")
+def parsed_valid_response():
+    """Parse the canned valid response once per module."""
+    return parse_response(VALID_JSON_RESPONSE)
 
 
 class TestRiskAnalysisPrompt:
     """Tests for risk analysis prompt building."""
 
-    def test_build_prompt_with_risks(self):
+    def test_build_prompt_with_risks(self, sample_prompt):
         """Test prompt construction with valid risks."""
-        context = {
-            "status_groups": [
-                (
-                    "At Risk",
-                    [
-                        {
-                            "deliverable": "Feature A",
-                            "risks_issues": "Resource constraints impacting delivery",
-                        }
-                    ],
-                ),
-                (
-                    "Off Track",
-                    [
-                        {
-                            "deliverable": "Feature B",
-                            "risks_issues": "Dependency delays from Team C",
-                        }
-                    ],
-                ),
-            ]
-        }
-
-        prompt = risk_analysis.build_prompt(context)
+        prompt = sample_prompt
 
         assert prompt is not None
         assert "Feature A" in prompt
@@ -45,33 +90,29 @@ class TestRiskAnalysisPrompt:
         assert "Cross-Cutting Themes" in prompt
         assert "JSON" in prompt
 
-    def test_build_prompt_no_risks(self):
-        """Test prompt returns None when no risks to analyze."""
-        context = {
-            "status_groups": [
-                (
-                    "On Track",
-                    [
-                        {
-                            "deliverable": "Feature A",
-                            "risks_issues": "No risks or issues reported this week",
-                        }
-                    ],
-                )
-            ]
-        }
-
-        prompt = risk_analysis.build_prompt(context)
-
-        assert prompt is None
-
-    def test_build_prompt_empty_status_groups(self):
-        """Test prompt returns None for empty status groups."""
-        context = {"status_groups": []}
-
-        prompt = risk_analysis.build_prompt(context)
-
-        assert prompt is None
+    @pytest.mark.parametrize(
+        "context",
+        [
+            {
+                "status_groups": [
+                    (
+                        "On Track",
+                        [
+                            {
+                                "deliverable": "Feature A",
+                                "risks_issues": "No risks or issues reported this week",
+                            }
+                        ],
+                    )
+                ]
+            },
+            {"status_groups": []},
+        ],
+        ids=["default-risk-text", "empty-status-groups"],
+    )
+    def test_build_prompt_returns_none(self, context):
+        """Test prompt returns None when there is nothing to analyze."""
+        assert build_prompt(context) is None
 
     def test_build_prompt_filters_empty_risks(self):
         """Test that empty/default risks are filtered out."""
@@ -89,7 +130,7 @@ class TestRiskAnalysisPrompt:
             ]
         }
 
-        prompt = risk_analysis.build_prompt(context)
+        prompt = build_prompt(context)
 
         assert prompt is not None
         assert "Feature A" in prompt
@@ -113,7 +154,7 @@ class TestRiskAnalysisPrompt:
             )
         ]
 
-        risks = risk_analysis._extract_risks(status_groups)
+        risks = _extract_risks(status_groups)
 
         assert len(risks) == 1
         assert risks[0]["deliverable"] == "Feature X"
@@ -144,7 +185,7 @@ class TestRiskAnalysisPrompt:
             ),
         ]
 
-        risks = risk_analysis._extract_risks(status_groups)
+        risks = _extract_risks(status_groups)
 
         assert len(risks) == 4
         deliverables = [r["deliverable"] for r in risks]
@@ -171,7 +212,7 @@ class TestRiskAnalysisPrompt:
             )
         ]
 
-        risks = risk_analysis._extract_risks(status_groups)
+        risks = _extract_risks(status_groups)
 
         assert len(risks) == 1
         assert risks[0]["deliverable"] == "A"
@@ -191,92 +232,36 @@ class TestRiskAnalysisPrompt:
             },
         ]
 
-        formatted = risk_analysis._format_risks(risks)
+        formatted = _format_risks(risks)
 
         assert "**Feature A** (At Risk)" in formatted
         assert "Risk: Resource constraints" in formatted
         assert "**Feature B** (Off Track)" in formatted
         assert "Risk: Dependency delays" in formatted
 
-    def test_parse_response_valid_json(self):
-        """Test parsing valid JSON response."""
-        response = """{
-            "themes": [
-                {
-                    "name": "Resource Constraints",
-                    "description": "Multiple teams facing staffing issues",
-                    "affected_deliverables": ["Feature A", "Feature B"],
-                    "severity": "high"
-                }
-            ],
-            "critical_risks": [
-                {
-                    "deliverable": "Feature A",
-                    "risk": "Team understaffed",
-                    "reason": "Impacts launch timeline"
-                }
-            ],
-            "anomalies": [
-                {
-                    "deliverable": "Feature C",
-                    "issue": "Marked On Track but has major risks"
-                }
-            ]
-        }"""
-
-        result = risk_analysis.parse_response(response)
+    @pytest.mark.parametrize(
+        "response,expect_parse_error",
+        [
+            (VALID_JSON_RESPONSE, False),
+            ('{"themes": []}', False),
+            ("This is not valid JSON", True),
+            ('{"themes": [], "critical_risks": [], "anomalies": []}', False),
+        ],
+        ids=["valid", "missing-fields", "invalid-json", "empty-arrays"],
+    )
+    def test_parse_response_structure(self, response, expect_parse_error):
+        """Test that every response yields the three keys plus an error flag."""
+        result = parse_response(response)
+
+        assert {"themes", "critical_risks", "anomalies"} <= result.keys()
+        assert ("parse_error" in result) is expect_parse_error
+
+    def test_parse_response_valid_json_content(self, parsed_valid_response):
+        """Test that valid JSON content comes through intact."""
+        result = parsed_valid_response
 
-        assert "themes" in result
         assert len(result["themes"]) == 1
         assert result["themes"][0]["name"] == "Resource Constraints"
         assert result["themes"][0]["severity"] == "high"
-
-        assert "critical_risks" in result
-        assert len(result["critical_risks"]) == 1
         assert result["critical_risks"][0]["deliverable"] == "Feature A"
-
-        assert "anomalies" in result
-        assert len(result["anomalies"]) == 1
         assert result["anomalies"][0]["deliverable"] == "Feature C"
-
-    def test_parse_response_missing_fields(self):
-        """Test parsing JSON with missing fields."""
-        response = '{"themes": []}'
-
-        result = risk_analysis.parse_response(response)
-
-        assert "themes" in result
-        assert "critical_risks" in result
-        assert "anomalies" in result
-        assert result["themes"] == []
-        assert result["critical_risks"] == []
-        assert result["anomalies"] == []
-
-    def test_parse_response_invalid_json(self):
-        """Test handling of malformed JSON."""
-        response = "This is not valid JSON"
-
-        result = risk_analysis.parse_response(response)
-
-        assert "themes" in result
-        assert "critical_risks" in result
-        assert "anomalies" in result
-        assert "parse_error" in result
-        assert result["themes"] == []
-        assert result["critical_risks"] == []
-        assert result["anomalies"] == []
-
-    def test_parse_response_empty_arrays(self):
-        """Test parsing response with empty arrays."""
-        response = """{
-            "themes": [],
-            "critical_risks": [],
-            "anomalies": []
-        }"""
-
-        result = risk_analysis.parse_response(response)
-
-        assert result["themes"] == []
-        assert result["critical_risks"] == []
-        assert result["anomalies"] == []
-        assert "parse_error" not in result
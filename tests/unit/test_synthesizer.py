@@ -7,6 +7,7 @@ from unittest.mock import Mock
 import pytest
 
 from report_generator.reasoning.synthesizer import ReportSynthesizer
+from tests.unit._fakes import FakeProvider
 
 
 class TestReportSynthesizer:
@@ -23,13 +24,12 @@ class TestReportSynthesizer:
 
     def test_synthesize_with_executive_summary(self):
         """Test synthesis with executive summary enabled."""
-        mock_provider = Mock()
-        mock_provider.generate.return_value = (
-            "Program is on track with 2 at-risk items requiring attention."
+        provider = FakeProvider(
+            ["Program is on track with 2 at-risk items requiring attention."],
+            model="claude-sonnet-4-5",
         )
-        mock_provider.model = "claude-sonnet-4-5"
 
-        synthesizer = ReportSynthesizer(mock_provider)
+        synthesizer = ReportSynthesizer(provider)
 
         context = {
             "total_deliverables": 10,
@@ -76,6 +76,8 @@ class TestReportSynthesizer:
         assert "synthesis" in result
         assert "executive_summary" in result["synthesis"]
         assert "risk_analysis" in result["synthesis"]
+        # Both features issued their own provider call
+        assert mock_provider.generate.call_count == 2
 
     def test_synthesize_executive_summary_disabled(self):
         """Test synthesis with executive summary disabled."""
@@ -110,11 +112,7 @@ class TestReportSynthesizer:
 
     def test_synthesize_preserves_original_context(self):
         """Test that synthesis doesn't modify original context."""
-        mock_provider = Mock()
-        mock_provider.generate.return_value = "Summary"
-        mock_provider.model = "test"
-
-        synthesizer = ReportSynthesizer(mock_provider)
+        synthesizer = ReportSynthesizer(FakeProvider(["Summary"]))
 
         original_context = {
             "total_deliverables": 10,
@@ -313,3 +311,153 @@ class TestReportSynthesizer:
         assert "prompt" in call_args.kwargs
         # Prompt should contain risk data
         assert "Real risk" in call_args.kwargs["prompt"]
+
+    def test_synthesize_caches_identical_prompts(self):
+        """Test that a repeated deterministic synthesis skips the provider."""
+        mock_provider = Mock()
+        mock_provider.generate.return_value = "Cached summary text."
+        mock_provider.model = "test"
+
+        synthesizer = ReportSynthesizer(mock_provider)  # temperature=0.0
+
+        context = {
+            "total_deliverables": 5,
+            "status_groups": [],
+            "report_date": "Test Date",
+        }
+
+        first = synthesizer.synthesize(
+            context, features={"executive_summary": True, "risk_analysis": False}
+        )
+        second = synthesizer.synthesize(
+            context, features={"executive_summary": True, "risk_analysis": False}
+        )
+
+        # Identical context at temperature 0.0 -> single provider call
+        assert mock_provider.generate.call_count == 1
+        assert first["synthesis"]["executive_summary"] == second["synthesis"]["executive_summary"]
+
+    def test_synthesize_does_not_cache_when_sampling(self):
+        """Test that non-zero temperature bypasses the response cache."""
+        mock_provider = Mock()
+        mock_provider.generate.return_value = "Sampled summary text."
+        mock_provider.model = "test"
+
+        synthesizer = ReportSynthesizer(mock_provider, temperature=0.3)
+
+        context = {
+            "total_deliverables": 5,
+            "status_groups": [],
+            "report_date": "Test Date",
+        }
+
+        synthesizer.synthesize(
+            context, features={"executive_summary": True, "risk_analysis": False}
+        )
+        synthesizer.synthesize(
+            context, features={"executive_summary": True, "risk_analysis": False}
+        )
+
+        # Sampling is non-deterministic, so each call hits the provider
+        assert mock_provider.generate.call_count == 2
+
+    def test_synthesize_many_uses_single_batch_call(self):
+        """Test that multi-report synthesis goes through one batch request."""
+        mock_provider = Mock()
+        mock_provider.generate_batch.return_value = [
+            "Report one summary.",
+            "Report two summary.",
+            "Report three summary.",
+        ]
+        mock_provider.model = "claude-sonnet-4-5"
+
+        synthesizer = ReportSynthesizer(mock_provider)
+
+        contexts = [
+            {"total_deliverables": i, "status_groups": [], "report_date": f"Week {i}"}
+            for i in range(1, 4)
+        ]
+
+        results = synthesizer.synthesize_many(
+            contexts, features={"executive_summary": True, "risk_analysis": False}
+        )
+
+        # One batch submission covering all contexts, no per-report calls
+        mock_provider.generate_batch.assert_called_once()
+        assert len(mock_provider.generate_batch.call_args.args[0]) == 3
+        mock_provider.generate.assert_not_called()
+
+        assert len(results) == 3
+        assert results[0]["synthesis"]["executive_summary"] == "Report one summary."
+        assert results[2]["synthesis"]["executive_summary"] == "Report three summary."
+        assert results[1]["total_deliverables"] == 2  # Original context preserved
+
+    def test_synthesize_many_failed_entry_degrades_gracefully(self):
+        """Test that a failed batch entry produces an error, not a crash."""
+        mock_provider = Mock()
+        # Second entry failed server-side; provider reports it as None
+        mock_provider.generate_batch.return_value = ["Fine summary.", None]
+        mock_provider.model = "test"
+
+        synthesizer = ReportSynthesizer(mock_provider)
+
+        contexts = [
+            {"total_deliverables": 1, "status_groups": []},
+            {"total_deliverables": 2, "status_groups": []},
+        ]
+
+        results = synthesizer.synthesize_many(
+            contexts, features={"executive_summary": True, "risk_analysis": False}
+        )
+
+        assert results[0]["synthesis"]["executive_summary"] == "Fine summary."
+        assert results[1]["synthesis"]["executive_summary"] is None
+        assert "executive_summary_error" in results[1]["synthesis"]
+
+    def test_synthesize_streaming_yields_deltas_then_result(self):
+        """Test that streaming synthesis emits chunks before the final result."""
+        mock_provider = Mock()
+        mock_provider.stream_generate.return_value = iter(
+            ["Program is on track. ", "No blockers this week."]
+        )
+        mock_provider.model = "test"
+
+        synthesizer = ReportSynthesizer(mock_provider)
+        context = {"total_deliverables": 3, "status_groups": []}
+
+        events = list(
+            synthesizer.synthesize_streaming(
+                context, features={"executive_summary": True, "risk_analysis": False}
+            )
+        )
+
+        deltas = [e["text"] for e in events if e["type"] == "executive_summary_delta"]
+        assert deltas == ["Program is on track. ", "No blockers this week."]
+
+        final = events[-1]
+        assert final["type"] == "result"
+        assert (
+            final["context"]["synthesis"]["executive_summary"]
+            == "Program is on track. No blockers this week."
+        )
+        assert final["context"]["total_deliverables"] == 3
+
+    def test_synthesize_streaming_graceful_degradation(self):
+        """Test that a streaming failure still produces a result event."""
+        mock_provider = Mock()
+        mock_provider.stream_generate.side_effect = Exception("Stream dropped")
+        mock_provider.model = "test"
+
+        synthesizer = ReportSynthesizer(mock_provider)
+
+        events = list(
+            synthesizer.synthesize_streaming(
+                {"total_deliverables": 1, "status_groups": []},
+                features={"executive_summary": True, "risk_analysis": False},
+            )
+        )
+
+        final = events[-1]
+        assert final["type"] == "result"
+        assert final["context"]["synthesis"]["executive_summary"] is None
+        assert "Stream dropped" in final["context"]["synthesis"]["executive_summary_error"]
@@ -330,6 +330,84 @@ class TestDataTransformer:
 
         assert result["doubled"] == "10"
 
+    def test_transform_with_vectorized_transformation(self):
+        """
+        Test whole-column transformations on the bulk path.
+
+        A vectorized variant should replace the per-element map above
+        the threshold while producing the same values as the scalar
+        function used by the row path.
+        """
+        field_mappings = {
+            "Number": "doubled",
+        }
+
+        def double_number(value):
+            return str(int(value) * 2)
+
+        transformer = DataTransformer(
+            field_mappings,
+            transformations={"doubled": double_number},
+            vectorized_transformations={
+                "doubled": lambda series: (series.astype(int) * 2).astype(str)
+            },
+        )
+
+        raw_data = [{"Number": str(i)} for i in range(40)]
+        result = transformer.transform(raw_data)
+
+        assert result == [transformer.transform_row(row) for row in raw_data]
+        assert result[5]["doubled"] == "10"
+
+    def test_transform_bulk_matches_row_path(self):
+        """
+        Test that the vectorized bulk path matches per-row results.
+
+        Above the vectorization threshold, transform() goes through
+        pandas column-wise; the output must be identical to applying
+        transform_row to each row, including missing columns, None/NaN
+        cells, integer values, and a raw column whose name collides
+        with a target field.
+        """
+        field_mappings = {
+            "Name": "name",
+            "Date Column": "formatted_date",
+            "Names Column": "name_list",
+            "Age": "age",
+        }
+
+        transformations = {
+            "formatted_date": format_date,
+            "name_list": split_multi_value_names,
+        }
+
+        raw_data = [
+            {
+                "Name": f"  Item {i}  ",
+                "Date Column": "12/15/2024" if i % 2 else "not a date",
+                "Names Column": "Alice, Bob, Alice",
+                "Age": 30,
+                "name": "raw column colliding with a target field",
+            }
+            for i in range(40)
+        ]
+        raw_data.append({"Name": None})  # Missing columns and None value
+        raw_data.append({"Name": float("nan"), "Date Column": float("nan")})  # NaN cells
+
+        transformer = DataTransformer(field_mappings, transformations)
+        result = transformer.transform(raw_data)
+
+        assert result == [transformer.transform_row(row) for row in raw_data]
+        assert result[0]["name"] == "Item 0"
+        assert result[1]["formatted_date"] == "Dec 15, 2024"
+        assert result[0]["name_list"] == ["Alice", "Bob"]
+        # Integers stay integers ("30", not "30.0") even though later
+        # rows leave the Age column with missing cells
+        assert result[0]["age"] == "30"
+        # None and NaN both normalize to empty on either path
+        assert result[-2] == {"name": "", "formatted_date": "", "name_list": [], "age": ""}
+        assert result[-1] == {"name": "", "formatted_date": "", "name_list": [], "age": ""}
+
 
 class TestPreserveLineBreaks:
     """Tests for preserve_line_breaks function."""